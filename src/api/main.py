@@ -2,7 +2,9 @@
 
 import os
 from contextlib import asynccontextmanager
+from typing import Optional
 
+import httpx
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -59,16 +61,24 @@ async def lifespan(app: FastAPI):
 
     # Skip background services and default data loading in test mode
     if not is_test_mode:
+        # Shared HTTP client so periodic feed fetches reuse keep-alive
+        # connections instead of reconnecting to the same hosts every cycle;
+        # the ingestion service closes it on its own event loop
+        app.state.http_client = httpx.AsyncClient(timeout=30, follow_redirects=True)
+
         # Initialize background ingestion service
         # This implements the "continuously fetch IT-related news"
         app.state.background_ingestion = BackgroundIngestionService(
             storage=app.state.storage,
             source_registry=app.state.source_registry,
             filter_registry=app.state.filter_registry,
+            http_client=app.state.http_client,
         )
 
         # Register default sources for continuous ingestion
-        await _register_default_sources(app.state.source_registry)
+        await _register_default_sources(
+            app.state.source_registry, app.state.http_client
+        )
 
         # Register default filters for content filtering
         await _register_default_filters(app.state.filter_registry)
@@ -100,7 +110,9 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 IT Newsfeed API shutting down...")
 
 
-async def _register_default_sources(source_registry: SourceRegistry) -> None:
+async def _register_default_sources(
+    source_registry: SourceRegistry, http_client: Optional[httpx.AsyncClient] = None
+) -> None:
     """Register default news sources for continuous background ingestion.
 
     This function sets up the real data sources:
@@ -111,6 +123,10 @@ async def _register_default_sources(source_registry: SourceRegistry) -> None:
     These sources will be automatically fetched in the background at regular intervals
     to provide continuous news updates for IT professionals.
 
+    Args:
+        source_registry: Registry to add the sources to
+        http_client: Shared HTTP client the RSS sources download their feeds with
+
     Potential Pitfalls Addressed:
     - Graceful handling of source registration failures
     - Logging of registered sources for monitoring
@@ -122,12 +138,16 @@ async def _register_default_sources(source_registry: SourceRegistry) -> None:
 
         rss_sources = [
             RSSSource(
-                "tomshardware", "https://www.tomshardware.com/feeds/all", max_items=10
+                "tomshardware",
+                "https://www.tomshardware.com/feeds/all",
+                max_items=10,
+                client=http_client,
             ),
             RSSSource(
                 "arstechnica",
                 "https://feeds.arstechnica.com/arstechnica/index",
                 max_items=10,
+                client=http_client,
             ),
         ]
         for source in rss_sources:
@@ -1,7 +1,7 @@
 """Ingest endpoint router for processing news items (modular refactor)."""
 
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from loguru import logger
@@ -41,10 +41,11 @@ def validate_item_fields(item) -> bool:
     return bool(item.id and item.title and item.published_at)
 
 
-async def is_duplicate(item, storage: NewsStore) -> bool:
-    """Check if the item already exists in storage by id."""
-    existing_item = await storage.get_by_id(item.id)
-    return existing_item is not None
+async def get_known_ids(items, storage: NewsStore) -> Set[str]:
+    """Look up which of the items' ids are already in storage, in one call."""
+    ids = [item.id for item in items]
+    existing = await storage.get_many(ids)
+    return {item_id for item_id, found in zip(ids, existing) if found is not None}
 
 
 async def filter_item(item, filter_registry: FilterRegistry) -> Tuple[float, str, bool]:
@@ -98,18 +99,23 @@ def summarize_results(results: List[Dict]) -> Dict:
     return summary
 
 
-async def process_item(item, storage, filter_registry) -> Dict:
-    """Process a single item: validate, check duplicate, filter, store if accepted."""
+async def process_item(item, storage, filter_registry, known_ids: Set[str]) -> Dict:
+    """Process a single item: validate, check duplicate, filter, store if accepted.
+
+    ``known_ids`` holds the ids already in storage and is updated as items are
+    stored, so duplicates within the same batch are detected too.
+    """
     try:
         if not validate_item_fields(item):
             logger.warning(f"Invalid item skipped: missing required fields - {item.id}")
             return {"result": "errors", "id": item.id, "reason": "missing fields"}
-        if await is_duplicate(item, storage):
+        if item.id in known_ids:
             logger.info(f"Duplicate item skipped: {item.id}")
             return {"result": "duplicates", "id": item.id, "reason": "duplicate"}
         score, reason, is_relevant = await filter_item(item, filter_registry)
         if is_relevant:
             await store_item(item, storage)
+            known_ids.add(item.id)
             logger.info(f"✅ Item accepted: {item.id} (score: {score:.3f}) - {reason}")
             return {
                 "result": "accepted",
@@ -192,9 +198,10 @@ async def ingest_news(
         logger.info(f"📥 Ingesting {len(request_data.items)} news items")
         if not request_data.items:
             raise HTTPException(status_code=400, detail="No items provided in request")
+        known_ids = await get_known_ids(request_data.items, storage)
         results = []
         for item in request_data.items:
-            result = await process_item(item, storage, filter_registry)
+            result = await process_item(item, storage, filter_registry, known_ids)
             results.append(result)
         summary_data = summarize_results(results)
         summary = IngestSummary(**summary_data)
@@ -1,9 +1,11 @@
 """Retrieve endpoint router for getting filtered news items."""
 
+import hashlib
 import os
-from typing import List
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from loguru import logger
 
 from src.models.api import (
@@ -30,13 +32,31 @@ def get_filter_registry(request: Request) -> FilterRegistry:
     return request.app.state.filter_registry
 
 
+def compute_etag(body: bytes) -> str:
+    """Compute a strong ETag for a serialized response body."""
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header matches the current ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 async def retrieve_and_filter_items(
-    storage: NewsStore, filter_registry: FilterRegistry
+    storage: NewsStore,
+    filter_registry: FilterRegistry,
+    since: Optional[datetime] = None,
 ) -> List[NewsItem]:
-    """Retrieve all items from storage and apply filters for ranking."""
+    """Retrieve items from storage and apply filters for ranking.
+
+    Only items published after ``since`` are loaded when it is given.
+    """
     try:
-        # Get all items from storage
-        all_items = await storage.get_all()
+        # Get items from storage, pushing the since predicate down
+        all_items = await storage.get_all(since=since)
         logger.info(f"📊 Retrieved {len(all_items)} items from storage")
 
         if not all_items:
@@ -57,32 +77,34 @@ async def retrieve_and_filter_items(
             f"🔍 Applying {len(filter_names)} filters to {len(all_items)} items"
         )
 
-        # Apply each filter and collect scores
-        for item in all_items:
-            scores = []
-            reasons = []
-
-            for filter_name in filter_names:
-                filter_instance = filter_registry.get_filter(filter_name)
-                if filter_instance:
-                    try:
-                        filtered_items = await filter_instance.filter([item])
-                        if filtered_items:
-                            filtered_item = filtered_items[0]
-                            # The filters now return clean numerical scores directly
-                            scores.append(filtered_item.relevance_score)
-                            breakdown = filtered_item.score_breakdown
-                            if breakdown:
-                                reasons.append(f"{filter_name}: {breakdown}")
-                    except Exception as e:
-                        logger.error(
-                            f"Filter {filter_name} failed for item {item.id}: {e}"
-                        )
+        # Run each filter once over the whole batch and collect scores
+        scores: Dict[str, List[float]] = {item.id: [] for item in all_items}
+        reasons: Dict[str, List[str]] = {item.id: [] for item in all_items}
+
+        for filter_name in filter_names:
+            filter_instance = filter_registry.get_filter(filter_name)
+            if not filter_instance:
+                continue
+            try:
+                filtered_items = await filter_instance.filter(all_items)
+            except Exception as e:
+                logger.error(f"Filter {filter_name} failed: {e}")
+                continue
+            for filtered_item in filtered_items:
+                item_id = filtered_item.item.id
+                # The filters now return clean numerical scores directly
+                scores[item_id].append(filtered_item.relevance_score)
+                breakdown = filtered_item.score_breakdown
+                if breakdown:
+                    reasons[item_id].append(f"{filter_name}: {breakdown}")
 
+        for item in all_items:
             # Take the highest score from all filters (highest signal wins)
-            item.relevance_score = max(scores) if scores else 0.0
+            item_scores = scores[item.id]
+            item_reasons = reasons[item.id]
+            item.relevance_score = max(item_scores) if item_scores else 0.0
             item.score_breakdown = (
-                "; ".join(reasons) if reasons else "No specific reason"
+                "; ".join(item_reasons) if item_reasons else "No specific reason"
             )
 
         # Filter by relevance threshold and sort by score (highest first)
@@ -123,6 +145,7 @@ router = APIRouter()
     tags=["Retrieve"],
     responses={
         200: {"description": "News items retrieved and filtered successfully"},
+        304: {"description": "Not modified - payload matches the If-None-Match ETag"},
         400: {
             "model": BadRequestErrorResponse,
             "description": "Bad request - invalid parameters",
@@ -138,9 +161,17 @@ router = APIRouter()
     },
 )
 async def retrieve_news(
+    request: Request,
+    since: Optional[datetime] = Query(
+        None,
+        description=(
+            "Only return items published after this ISO-8601 timestamp "
+            "(UTC is assumed when no offset is given)"
+        ),
+    ),
     storage: NewsStore = Depends(get_storage),
     filter_registry: FilterRegistry = Depends(get_filter_registry),
-) -> RetrieveResponse:
+) -> Response:
     """Retrieve filtered news events with AI-powered ranking and relevance scoring.
 
     This endpoint implements the exact API contract:
@@ -163,15 +194,25 @@ async def retrieve_news(
 
     This endpoint is deterministic and will return the same results
     for identical data sets, making it suitable for automated testing.
+
+    Every response carries an `ETag` computed from the serialized payload.
+    Clients can send it back in `If-None-Match` to receive an empty
+    `304 Not Modified` when nothing has changed since their last call.
+
+    Pass `since` to fetch only items published after a given time, so a
+    polling client can pull deltas and merge them into what it already has.
     """
     try:
         logger.info("📥 Retrieving filtered news items")
 
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
         # Retrieve and filter items
-        items = await retrieve_and_filter_items(storage, filter_registry)
+        items = await retrieve_and_filter_items(storage, filter_registry, since)
 
         # Get total count for statistics
-        total_items_in_storage = len(await storage.get_all())
+        total_items_in_storage = await storage.count()
 
         # Build filtering info
         filtering_info = {
@@ -184,10 +225,21 @@ async def retrieve_news(
             f"📊 Retrieved {len(items)} items (from {total_items_in_storage} total)"
         )
 
-        return RetrieveResponse(
+        response = RetrieveResponse(
             items=items, total=len(items), filtering_info=filtering_info
         )
 
+        # Serialize once so the ETag matches the exact bytes sent to the client
+        body = response.model_dump_json().encode()
+        etag = compute_etag(body)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            logger.info("📭 Retrieve payload unchanged - returning 304")
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return Response(
+            content=body, media_type="application/json", headers={"ETag": etag}
+        )
+
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
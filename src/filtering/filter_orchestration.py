@@ -1,7 +1,9 @@
 """Filter orchestration for coordinating multiple filters and scoring."""
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 
+import numpy as np
 from loguru import logger
 
 from src.models.news_item import NewsItem
@@ -37,6 +39,23 @@ class FilterOrchestration:
         self.weights = weights or {}
         logger.info(f"FilterOrchestration initialized with {len(self.weights)} weights")
 
+    @property
+    def weights(self) -> Mapping[str, float]:
+        """Weights mapping filter names to their share of the final score.
+
+        Read-only: assign a new mapping (or call set_weights) to change them,
+        so the cached weight vector stays in sync.
+        """
+        return MappingProxyType(self._weights)
+
+    @weights.setter
+    def weights(self, weights: Mapping[str, float]) -> None:
+        # Bind a private copy of the weights to a fixed filter order and vector
+        # once, so each apply_filters call goes straight to the matrix products
+        self._weights = dict(weights)
+        self._filter_names = list(weights.keys())
+        self._weight_vector = np.array(list(weights.values()), dtype=float)
+
     def set_weights(self, weights: Dict[str, float]) -> None:
         """Set the weights for filter scoring.
 
@@ -119,44 +138,41 @@ class FilterOrchestration:
         Returns:
             List of FilteredItem objects with combined scores
         """
-        combined_items = []
-
-        for item in items:
-            # Collect scores from all filters
-            score_breakdown = {}
-            total_weighted_score = 0.0
-            total_weight = 0.0
-
-            for filter_name, filter_weight in self.weights.items():
-                if filter_name in filter_results:
-                    # Find this item's score from this filter
-                    filter_result = next(
-                        (
-                            fr
-                            for fr in filter_results[filter_name]
-                            if fr.item.id == item.id
-                        ),
-                        None,
-                    )
-
-                    if filter_result:
-                        score = filter_result.relevance_score
-                        score_breakdown[filter_name] = score
-                        total_weighted_score += score * filter_weight
-                        total_weight += filter_weight
-                    else:
-                        # Item not found in this filter's results
-                        score_breakdown[filter_name] = 0.0
-                else:
-                    # Filter failed or not available
-                    score_breakdown[filter_name] = 0.0
-
-            # Calculate final weighted score
-            if total_weight > 0:
-                final_score = total_weighted_score / total_weight
-            else:
-                final_score = 0.0
+        filter_names = self._filter_names
+        weights = self._weight_vector
+
+        # (n_items, n_filters) score matrix plus a mask of which scores exist;
+        # an item missing from a filter's results (or a failed filter) scores
+        # 0.0 in the breakdown and does not count towards the total weight
+        scores = np.zeros((len(items), len(filter_names)))
+        present = np.zeros((len(items), len(filter_names)), dtype=bool)
+        for col, filter_name in enumerate(filter_names):
+            # Map item id -> score (first result wins, as before)
+            score_by_id: Dict[str, float] = {}
+            for filter_result in filter_results.get(filter_name, []):
+                score_by_id.setdefault(
+                    filter_result.item.id, filter_result.relevance_score
+                )
+            for row, item in enumerate(items):
+                if item.id in score_by_id:
+                    scores[row, col] = score_by_id[item.id]
+                    present[row, col] = True
+
+        # Calculate final weighted scores in one pass
+        total_weight = present @ weights
+        final_scores = np.divide(
+            scores @ weights,
+            total_weight,
+            out=np.zeros(len(items)),
+            where=total_weight > 0,
+        )
+        final_scores = np.clip(final_scores, 0.0, 1.0)
 
+        combined_items = []
+        for item, item_scores, final_score in zip(
+            items, scores.tolist(), final_scores.tolist()
+        ):
+            score_breakdown = dict(zip(filter_names, item_scores))
             # Add final score to breakdown
             score_breakdown["final"] = final_score
 
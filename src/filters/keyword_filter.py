@@ -93,6 +93,13 @@ class KeywordFilter(NewsFilter):
             "version",
         }
 
+        # Compile the matchers for each tier once, so each item is scanned a
+        # single time per tier (for the current keyword sets) instead of once
+        # per keyword
+        self._high_matchers = self._compile_keywords(self.high_priority_keywords)
+        self._medium_matchers = self._compile_keywords(self.medium_priority_keywords)
+        self._low_matchers = self._compile_keywords(self.low_priority_keywords)
+
     @property
     def name(self) -> str:
         """Get the filter name."""
@@ -135,13 +142,13 @@ class KeywordFilter(NewsFilter):
         Returns:
             Dictionary of keyword category scores
         """
-        # Combine title and body for analysis
-        text = f"{item.title} {item.body or ''}".lower()
+        # Combined, lower-cased title and body (computed once per item)
+        text = item.normalized_text
 
         # Count keyword matches by priority
-        high_matches = self._count_keywords(text, self.high_priority_keywords)
-        medium_matches = self._count_keywords(text, self.medium_priority_keywords)
-        low_matches = self._count_keywords(text, self.low_priority_keywords)
+        high_matches = self._count_keywords(text, self._high_matchers)
+        medium_matches = self._count_keywords(text, self._medium_matchers)
+        low_matches = self._count_keywords(text, self._low_matchers)
 
         # Calculate scores (high priority gets more weight)
         high_score = min(high_matches * 0.3, 1.0)  # Max 1.0
@@ -156,21 +163,55 @@ class KeywordFilter(NewsFilter):
 
         return breakdown
 
-    def _count_keywords(self, text: str, keywords: set) -> int:
+    @staticmethod
+    def _compile_keywords(keywords: set) -> List[re.Pattern]:
+        """Compile as few matchers as possible for a whole set of keywords.
+
+        Each alternation sits inside a zero-width lookahead, so a match at one
+        position does not consume text and overlapping keywords (e.g.
+        "microsoft azure" and "azure") are each counted, as they were when
+        every keyword was searched separately.
+
+        A lookahead still reports at most one keyword per position, so a
+        keyword that also matches as a whole word at the start of another
+        (e.g. "microsoft" and "microsoft azure", but not "data" and
+        "database") is put in a separate matcher. Without such pairs, which
+        is the case for the built-in keyword sets, a single matcher is
+        returned.
+
+        Args:
+            keywords: Set of keywords to compile
+
+        Returns:
+            Compiled patterns that together match once per keyword occurrence
+        """
+        groups: List[List[str]] = []
+        for keyword in sorted(keywords, key=lambda kw: (-len(kw), kw)):
+            for group in groups:
+                # Longer keywords come first, so only this keyword can be a
+                # whole-word prefix of one already in the group
+                if not any(
+                    re.match(rf"{re.escape(keyword)}\b", other) for other in group
+                ):
+                    group.append(keyword)
+                    break
+            else:
+                groups.append([keyword])
+
+        # Use word boundaries to avoid partial matches
+        return [
+            re.compile(rf"\b(?=(?:{'|'.join(map(re.escape, group))})\b)")
+            for group in groups
+        ]
+
+    def _count_keywords(self, text: str, patterns: List[re.Pattern]) -> int:
         """Count occurrences of keywords in text.
 
         Args:
             text: Text to search in
-            keywords: Set of keywords to search for
+            patterns: Compiled keyword matchers for one priority tier
 
         Returns:
             Number of keyword matches found
         """
-        count = 0
-        for keyword in keywords:
-            # Use word boundaries to avoid partial matches
-            pattern = r"\b" + re.escape(keyword) + r"\b"
-            matches = re.findall(pattern, text)
-            count += len(matches)
-
-        return count
+        return sum(len(pattern.findall(text)) for pattern in patterns)
@@ -1,5 +1,7 @@
 """Semantic filter using sentence embeddings for relevance scoring."""
 
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import numpy as np
@@ -9,6 +11,26 @@ from sentence_transformers import SentenceTransformer
 from src.models.news_item import NewsItem
 from src.registry import FilteredItem, NewsFilter
 
+# Using all-MiniLM-L6-v2 for optimal balance of speed and accuracy
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=None)
+def load_model(model_name: str = DEFAULT_MODEL_NAME) -> SentenceTransformer:
+    """Load a sentence-transformer model, once per process.
+
+    Every SemanticFilter built without an explicit model shares the same
+    instance, so the weights are only read from disk the first time.
+
+    Args:
+        model_name: Name of the sentence-transformers model to load
+
+    Returns:
+        The loaded (and cached) SentenceTransformer
+    """
+    logger.info(f"Loading sentence-transformers model: {model_name}")
+    return SentenceTransformer(model_name)
+
 
 class SemanticFilter(NewsFilter):
     """Semantic filter using sentence embeddings for IT news relevance.
@@ -20,11 +42,16 @@ class SemanticFilter(NewsFilter):
     Uses sentence-transformers with all-MiniLM-L6-v2 for semantic understanding.
     """
 
-    def __init__(self, model: Optional[SentenceTransformer] = None):
+    def __init__(
+        self,
+        model: Optional[SentenceTransformer] = None,
+        max_cache_size: int = 10_000,
+    ):
         """Initialize the semantic filter with sentence embeddings.
 
         Args:
             model: Optional pre-loaded SentenceTransformer model for testing
+            max_cache_size: Maximum number of text embeddings kept in memory
         """
         # IT-relevant topic phrases for semantic matching
         self.it_topics = [
@@ -40,16 +67,28 @@ class SemanticFilter(NewsFilter):
             "disaster recovery",
         ]
 
-        # Initialize sentence transformer model
-        # Using all-MiniLM-L6-v2 for optimal balance of speed and accuracy
+        # Initialize sentence transformer model (shared across instances)
         if model is not None:
             self.model = model
             logger.info("Semantic filter initialized with provided model")
         else:
-            self.model = SentenceTransformer("all-MiniLM-L6-v2")
+            self.model = load_model()
             logger.info("Semantic filter initialized with sentence-transformers")
 
         self.topic_embeddings = self.model.encode(self.it_topics)
+        # Unit-length topic vectors, so cosine similarity is a single matmul
+        self._topic_matrix = self._normalize(self.topic_embeddings)
+        self._topic_keys = [
+            f"topic_{topic.replace(' ', '_')}" for topic in self.it_topics
+        ]
+
+        # Unit-length float16 text embeddings keyed by the exact text that was
+        # encoded, so items re-scored on every /retrieve call skip the encoder
+        self.max_cache_size = max_cache_size
+        self._embedding_cache: Dict[str, np.ndarray] = {}
+        # The filter is shared by the API event loop and the background
+        # ingestion thread, so cache reads and writes are serialized
+        self._cache_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -59,21 +98,26 @@ class SemanticFilter(NewsFilter):
     async def filter(self, items: List[NewsItem]) -> List[FilteredItem]:
         """Filter news items based on semantic relevance.
 
+        All texts are encoded in one batched model call and scored against
+        the topics with a single matrix product.
+
         Args:
             items: List of news items to filter
 
         Returns:
             List of FilteredItem objects with semantic-based scores
         """
-        filtered_items = []
+        if not items:
+            return []
 
-        for item in items:
-            score_breakdown = await self.get_score_breakdown(item)
-            relevance_score = score_breakdown.get("overall_semantic", 0.0)
+        similarities = self._topic_similarities([self._item_text(i) for i in items])
 
+        filtered_items = []
+        for item, row in zip(items, similarities):
+            score_breakdown = self._build_breakdown(row)
             filtered_item = FilteredItem(
                 item=item,
-                relevance_score=relevance_score,
+                relevance_score=score_breakdown["overall_semantic"],
                 score_breakdown=score_breakdown,
             )
             filtered_items.append(filtered_item)
@@ -90,64 +134,99 @@ class SemanticFilter(NewsFilter):
         Returns:
             Dictionary of semantic similarity scores
         """
-        # Combine title and body for analysis
-        text = f"{item.title} {item.body or ''}".lower()
+        similarities = self._topic_similarities([self._item_text(item)])
+        return self._build_breakdown(similarities[0])
 
-        # Calculate semantic similarity to IT topics
-        topic_scores = {}
+    def _item_text(self, item: NewsItem) -> str:
+        """Get the normalized text that is encoded for an item."""
+        return item.normalized_text
 
-        for i, topic in enumerate(self.it_topics):
-            similarity = self._calculate_similarity(text, i)
-            topic_scores[f"topic_{topic.replace(' ', '_')}"] = similarity
+    def _build_breakdown(self, similarities: np.ndarray) -> Dict[str, float]:
+        """Build the per-topic score breakdown from one row of similarities.
 
-        # Calculate overall semantic score (maximum similarity)
-        if topic_scores:
-            max_similarity = max(topic_scores.values())
-            topic_scores["overall_semantic"] = float(max_similarity)
-        else:
-            topic_scores["overall_semantic"] = 0.0
+        Args:
+            similarities: Non-negative similarity to each topic
 
+        Returns:
+            Dictionary of semantic similarity scores
+        """
         # Ensure all values are Python floats for Pydantic serialization
-        return {k: float(v) for k, v in topic_scores.items()}
+        topic_scores = dict(zip(self._topic_keys, similarities.tolist()))
+
+        # Calculate overall semantic score (maximum similarity)
+        topic_scores["overall_semantic"] = (
+            float(similarities.max()) if similarities.size else 0.0
+        )
+        return topic_scores
 
-    def _calculate_similarity(self, text: str, topic_index: int) -> float:
-        """Calculate semantic similarity between text and topic.
+    def _topic_similarities(self, texts: List[str]) -> np.ndarray:
+        """Calculate cosine similarity between each text and every topic.
 
         Args:
-            text: Text to analyze
-            topic_index: Index of topic in self.it_topics
+            texts: Normalized texts to analyze
 
         Returns:
-            Cosine similarity score between 0.0 and 1.0
+            Array of shape (len(texts), len(it_topics)) with scores in [0, 1]
         """
-        # Encode the text
-        text_embedding = self.model.encode([text])[0]
-
-        # Get pre-computed topic embedding
-        topic_embedding = self.topic_embeddings[topic_index]
+        # Upcast for the matmul: NumPy has no BLAS kernel for float16
+        embeddings = self._get_embeddings(texts).astype(np.float32)
+        similarities = embeddings @ self._topic_matrix.T
 
-        # Calculate cosine similarity
-        similarity = self._cosine_similarity(text_embedding, topic_embedding)
+        # Ensure non-negative scores
+        return np.clip(similarities, 0.0, 1.0)
 
-        # Ensure non-negative score
-        return max(0.0, similarity)
+    def _get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Get embeddings for texts, encoding all cache misses in one batch.
 
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors.
+        New embeddings are normalized once and stored as float16, which
+        halves the cache's memory; cosine scores in [0, 1] change by well
+        under 1e-3.
 
         Args:
-            vec1: First vector
-            vec2: Second vector
+            texts: Normalized texts to encode
 
         Returns:
-            Cosine similarity score
+            Array of unit-length float16 embeddings, one row per text
+        """
+        with self._cache_lock:
+            embeddings = {text: self._embedding_cache.get(text) for text in texts}
+        misses = [text for text, emb in embeddings.items() if emb is None]
+
+        if misses:
+            # Encode outside the lock; another thread may encode the same text
+            # concurrently, which only costs a duplicate cache write
+            encoded = self.model.encode(misses, batch_size=32, convert_to_numpy=True)
+            encoded = self._normalize(encoded).astype(np.float16)
+            with self._cache_lock:
+                for text, embedding in zip(misses, encoded):
+                    embeddings[text] = embedding
+                    self._cache_embedding(text, embedding)
+
+        return np.stack([embeddings[text] for text in texts])
+
+    def _cache_embedding(self, text: str, embedding: np.ndarray) -> None:
+        """Store an embedding, evicting the oldest entry when the cache is full.
+
+        Must be called with ``_cache_lock`` held.
         """
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        if (
+            text not in self._embedding_cache
+            and len(self._embedding_cache) >= self.max_cache_size
+        ):
+            # Dicts keep insertion order, so the first key is the oldest
+            self._embedding_cache.pop(next(iter(self._embedding_cache)), None)
+        self._embedding_cache[text] = embedding
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Scale vectors to unit length, leaving zero vectors at zero.
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+        Args:
+            vectors: 2-D array of vectors, one per row
 
-        # Convert numpy.float32 to Python float for Pydantic serialization
-        return float(dot_product / (norm1 * norm2))
+        Returns:
+            Array of the same shape with unit-length (or zero) rows
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0)
@@ -12,9 +12,9 @@ Key Features:
 
 import asyncio
 import threading
-import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+import httpx
 from loguru import logger
 
 from src.models.news_item import NewsItem
@@ -34,6 +34,8 @@ class BackgroundIngestionService:
         storage: NewsStore,
         source_registry: SourceRegistry,
         filter_registry: FilterRegistry,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrent_fetches: int = 8,
     ):
         """Initialize the background ingestion service.
 
@@ -41,14 +43,21 @@ class BackgroundIngestionService:
             storage: Storage instance for persisting items
             source_registry: Registry containing news sources
             filter_registry: Registry containing filters
+            http_client: HTTP client shared by the sources. Its connections
+                live on the ingestion thread's event loop, so the service
+                closes it when that loop shuts down.
+            max_concurrent_fetches: Maximum number of sources fetched at once
         """
         self.storage = storage
         self.source_registry = source_registry
         self.filter_registry = filter_registry
+        self.http_client = http_client
+        self.max_concurrent_fetches = max_concurrent_fetches
 
         # Simple state management
         self.running = False
         self.thread = None
+        self._stop_event = threading.Event()
 
         # Track processed items to avoid duplicates
         self.processed_items: set[str] = set()
@@ -56,18 +65,20 @@ class BackgroundIngestionService:
         logger.info("BackgroundIngestionService initialized")
 
     async def start(self) -> None:
-        """Start the background ingestion service."""
+        """Start the background ingestion service.
+
+        The background thread runs the initial fetch right away, so every
+        fetch (and every pooled HTTP connection) stays on that thread's loop.
+        """
         try:
             self.running = True
+            self._stop_event.clear()
             self.thread = threading.Thread(target=self._run_loop)
             self.thread.daemon = True  # Don't block app shutdown
             self.thread.start()
 
             logger.info("✅ Background ingestion service started")
 
-            # Run initial fetch
-            await self._fetch_all_sources()
-
         except Exception as e:
             logger.error(f"❌ Failed to start background ingestion service: {e}")
             raise
@@ -76,6 +87,7 @@ class BackgroundIngestionService:
         """Stop the background ingestion service."""
         try:
             self.running = False
+            self._stop_event.set()  # Wake the thread if it is waiting
             if self.thread and self.thread.is_alive():
                 self.thread.join(timeout=5)  # Wait max 5 seconds
                 logger.info("🛑 Background ingestion service stopped")
@@ -84,32 +96,58 @@ class BackgroundIngestionService:
             logger.error(f"❌ Error stopping background ingestion service: {e}")
 
     def _run_loop(self) -> None:
-        """Main background loop that runs in a separate thread."""
-        while self.running:
-            try:
-                # Run the async fetch in the thread
-                asyncio.run(self._fetch_all_sources())
-            except Exception as e:
-                logger.error(f"❌ Background ingestion error: {e}")
+        """Main background loop that runs in a separate thread.
 
-            # Wait 5 minutes before next fetch
-            time.sleep(300)
+        One event loop is kept for the lifetime of the thread, so keep-alive
+        connections of the shared HTTP client survive between fetch cycles.
+        """
+        with asyncio.Runner() as runner:
+            while self.running:
+                try:
+                    # Run the async fetch in the thread
+                    runner.run(self._fetch_all_sources())
+                except Exception as e:
+                    logger.error(f"❌ Background ingestion error: {e}")
+
+                # Wait 5 minutes before next fetch (returns early on stop)
+                self._stop_event.wait(300)
+
+            if self.http_client is not None:
+                runner.run(self.http_client.aclose())
 
     async def _fetch_all_sources(self) -> None:
         """Fetch from all registered sources."""
         logger.info("🔄 Starting background fetch from all sources")
 
         try:
-            sources = self.source_registry.list_sources()
+            sources = [
+                (name, self.source_registry.get_source(name))
+                for name in self.source_registry.list_sources()
+            ]
+            sources = [(name, source) for name, source in sources if source]
+
+            # Fetch from sources concurrently, at most max_concurrent_fetches at
+            # a time; a failing source must not stop the others, so exceptions
+            # are returned instead of raised
+            semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+            async def fetch(source) -> List[NewsItem]:
+                async with semaphore:
+                    return await source.fetch_items()
+
+            results = await asyncio.gather(
+                *(fetch(source) for _, source in sources),
+                return_exceptions=True,
+            )
 
-            for source_name in sources:
+            for (source_name, _), result in zip(sources, results):
+                if isinstance(result, Exception):
+                    logger.error(f"❌ Error fetching from {source_name}: {result}")
+                    continue
                 try:
-                    source = self.source_registry.get_source(source_name)
-                    if source:
-                        items = await source.fetch_items()
-                        await self._process_items(items, source_name)
+                    await self._process_items(result, source_name)
                 except Exception as e:
-                    logger.error(f"❌ Error fetching from {source_name}: {e}")
+                    logger.error(f"❌ Error processing items from {source_name}: {e}")
 
             logger.info("✅ Background fetch complete")
 
@@ -121,7 +159,7 @@ class BackgroundIngestionService:
         if not items:
             return
 
-        accepted_count = 0
+        accepted: List[NewsItem] = []
 
         for item in items:
             try:
@@ -133,9 +171,7 @@ class BackgroundIngestionService:
                 score, reason, is_relevant = await self._apply_filters(item)
 
                 if is_relevant:
-                    # Store the item
-                    await self.storage.add_item(item)
-                    accepted_count += 1
+                    accepted.append(item)
                     logger.debug(f"✅ Accepted item {item.id} (score: {score:.2f})")
                 else:
                     logger.debug(f"❌ Rejected item {item.id} (score: {score:.2f})")
@@ -146,10 +182,12 @@ class BackgroundIngestionService:
             except Exception as e:
                 logger.error(f"❌ Error processing item {item.id}: {e}")
 
-        if accepted_count > 0:
+        if accepted:
+            # Store all relevant items through the bulk path
+            await self.storage.add_items(accepted)
             logger.info(
                 f"📊 Processed {len(items)} items from {source_name}, "
-                f"accepted {accepted_count}"
+                f"accepted {len(accepted)}"
             )
 
     async def _apply_filters(self, item: NewsItem) -> tuple[float, str, bool]:
@@ -215,13 +253,9 @@ class BackgroundIngestionService:
 #    - Allow different fetch intervals per source via config or environment
 #      variables.
 #
-# 3. Batch Processing
-#    - Support batch processing for large numbers of items to improve
-#      efficiency.
-#
-# 4. Performance & Health Monitoring
+# 3. Performance & Health Monitoring
 #    - Add basic metrics (fetch times, error counts) and simple health checks
 #      for sources.
 #
-# 5. Move Hardcoded Values to Config
+# 4. Move Hardcoded Values to Config
 #    - Use config files or environment variables for all tunable parameters.
@@ -3,7 +3,14 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_serializer,
+    field_validator,
+)
 
 
 class NewsItem(BaseModel):
@@ -59,6 +66,25 @@ class NewsItem(BaseModel):
         None, description="Explanation of relevance scoring"
     )
 
+    # (title, body, normalized text) the cached value was derived from
+    _normalized_cache: Optional[tuple] = PrivateAttr(default=None)
+
+    @property
+    def normalized_text(self) -> str:
+        """Lower-cased title and body, as analyzed by the filters.
+
+        Computed once per item and shared by every filter (and every
+        re-scoring of the same item object). The cache remembers the title
+        and body it was built from, so it is rebuilt after either changes
+        through assignment or ``model_copy(update=...)``. Not part of the API
+        contract and not included in serialization.
+        """
+        cache = self._normalized_cache
+        if cache is None or cache[0] is not self.title or cache[1] is not self.body:
+            text = f"{self.title} {self.body or ''}".lower()
+            cache = self._normalized_cache = (self.title, self.body, text)
+        return cache[2]
+
     @field_serializer("published_at")
     def serialize_published_at(self, value: datetime) -> str:
         """Serialize datetime to ISO-8601 format with 'Z' suffix for UTC.
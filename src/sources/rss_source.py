@@ -5,11 +5,15 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 import feedparser
+import httpx
 from loguru import logger
 
 from src.models.news_item import NewsItem
 from src.registry.interfaces import NewsSource
 
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 class RSSSource(NewsSource):
     """RSS feed source for IT news websites.
@@ -24,17 +28,40 @@ class RSSSource(NewsSource):
     - Realistic IT news content
     """
 
-    def __init__(self, name: str, feed_url: str, max_items: int = 10):
+    def __init__(
+        self,
+        name: str,
+        feed_url: str,
+        max_items: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+    ):
         """Initialize the RSS source.
 
         Args:
             name: Name of the source (e.g., "tomshardware", "arstechnica")
             feed_url: URL of the RSS feed
             max_items: Maximum number of items to fetch (default: 10)
+            client: Shared HTTP client used to download the feed. Reusing one
+                client keeps connections (and TLS sessions) alive across
+                fetches. Without it, feedparser downloads the feed itself.
+            max_retries: Retries of a client download after a transport error
+                or a retryable status (429/5xx) (default: 2)
+            retry_backoff: Delay before the first retry in seconds, doubled on
+                every further retry (default: 0.5)
+
+        Raises:
+            ValueError: If max_retries is negative
         """
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be at least 0, got {max_retries}")
         self._name = name
         self._feed_url = feed_url
         self._max_items = max_items
+        self._client = client
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
         logger.info(f"RSSSource initialized: {name}, {feed_url}, max {max_items} items")
 
     @property
@@ -51,9 +78,13 @@ class RSSSource(NewsSource):
         logger.info(f"Fetching RSS items from {self._name}: {self._feed_url}")
 
         try:
+            content = None
+            if self._client is not None:
+                content = await self._download()
+
             # Use asyncio to run feedparser in a thread pool
             loop = asyncio.get_event_loop()
-            feed = await loop.run_in_executor(None, self._parse_feed)
+            feed = await loop.run_in_executor(None, self._parse_feed, content)
 
             if not feed or not feed.entries:
                 logger.warning(f"No entries found in RSS feed: {self._feed_url}")
@@ -76,14 +107,48 @@ class RSSSource(NewsSource):
             logger.error(f"Error fetching RSS feed {self._feed_url}: {e}")
             return []
 
-    def _parse_feed(self) -> Optional[feedparser.FeedParserDict]:
+    async def _download(self) -> bytes:
+        """Download the feed with the shared client, retrying transient failures.
+
+        Returns:
+            Raw feed document
+
+        Raises:
+            httpx.HTTPError: If the last attempt still fails
+        """
+        for attempt in range(self._max_retries + 1):
+            is_last = attempt == self._max_retries
+            try:
+                response = await self._client.get(self._feed_url)
+            except httpx.TransportError as e:
+                if is_last:
+                    raise
+                logger.warning(f"Retrying RSS feed {self._feed_url} after: {e}")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or is_last:
+                    response.raise_for_status()
+                    return response.content
+                logger.warning(
+                    f"Retrying RSS feed {self._feed_url} after HTTP "
+                    f"{response.status_code}"
+                )
+
+            await asyncio.sleep(self._retry_backoff * 2**attempt)
+
+    def _parse_feed(
+        self, content: Optional[bytes] = None
+    ) -> Optional[feedparser.FeedParserDict]:
         """Parse the RSS feed synchronously.
 
+        Args:
+            content: Already downloaded feed document; if None, feedparser
+                fetches the feed URL itself
+
         Returns:
             Parsed feed data or None if parsing fails
         """
         try:
-            feed = feedparser.parse(self._feed_url)
+            feed = feedparser.parse(content if content is not None else self._feed_url)
 
             # Check for parsing errors
             if hasattr(feed, "bozo") and feed.bozo:
@@ -1,9 +1,11 @@
 """In-memory storage implementation for the newsfeed system."""
 
 import asyncio
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
+from sortedcontainers import SortedList
 
 from src.models.news_item import NewsItem
 
@@ -17,6 +19,8 @@ class InMemoryStore(NewsStore):
     - Thread-safe operations using asyncio.Lock
     - Duplicate detection by ID
     - Efficient O(1) lookups
+    - Sorted (published_at, id) index with O(log n) inserts and ``since``
+      lookups, so reads never re-sort the whole store
     - Consistent ordering for deterministic results
     - Structured logging for all operations
     """
@@ -24,6 +28,8 @@ class InMemoryStore(NewsStore):
     def __init__(self):
         """Initialize the in-memory store."""
         self._items: Dict[str, NewsItem] = {}
+        # Ascending (published_at, id) keys, kept sorted on insert
+        self._index: SortedList[Tuple[datetime, str]] = SortedList()
         self._lock = asyncio.Lock()
         logger.info("InMemoryStore initialized")
 
@@ -42,41 +48,84 @@ class InMemoryStore(NewsStore):
                 return False
 
             self._items[item.id] = item
+            self._index.add((item.published_at, item.id))
             logger.info(f"Added item: {item.id} from {item.source}")
             return True
 
-    async def add_items(self, items: List[NewsItem]) -> int:
+    async def add_items(self, items: List[NewsItem], *, batch_size: int = 500) -> int:
         """Add multiple news items to storage.
 
+        Items are written in batches, taking the lock once per batch and
+        yielding to the event loop between batches, so a large insert does not
+        block readers for its whole duration. Other readers and writers may
+        therefore run between batches; each batch is applied atomically, but
+        the insert as a whole is not.
+
         Args:
             items: List of news items to add
+            batch_size: Maximum number of items written per lock acquisition
 
         Returns:
             Number of items successfully added (excluding duplicates)
-        """
-        async with self._lock:
-            added_count = 0
-            for item in items:
-                if item.id not in self._items:
-                    self._items[item.id] = item
-                    added_count += 1
-                    logger.debug(f"Added item: {item.id}")
-                else:
-                    logger.debug(f"Skipped duplicate: {item.id}")
 
-            logger.info(f"Added {added_count}/{len(items)} items")
-            return added_count
+        Raises:
+            ValueError: If batch_size is smaller than 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        added_count = 0
+        for start in range(0, len(items), batch_size):
+            if start:
+                # An uncontended lock never suspends, so yield explicitly to
+                # let waiting readers and writers run between batches
+                await asyncio.sleep(0)
+            async with self._lock:
+                for item in items[start : start + batch_size]:
+                    if item.id not in self._items:
+                        self._items[item.id] = item
+                        self._index.add((item.published_at, item.id))
+                        added_count += 1
+                        logger.debug(f"Added item: {item.id}")
+                    else:
+                        logger.debug(f"Skipped duplicate: {item.id}")
+
+        logger.info(f"Added {added_count}/{len(items)} items")
+        return added_count
+
+    async def get_all(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[NewsItem]:
+        """Retrieve news items from storage, newest first.
 
-    async def get_all(self) -> List[NewsItem]:
-        """Retrieve all news items from storage.
+        Args:
+            since: Only return items published strictly after this time
+            limit: Maximum number of items to return (newest are kept)
 
         Returns:
-            List of all stored news items in consistent order
+            List of matching stored news items in consistent order
+
+        Raises:
+            ValueError: If limit is negative
         """
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must not be negative, got {limit}")
+
         async with self._lock:
-            # Sort by published_at DESC, then by id ASC for consistent ordering
-            items = list(self._items.values())
-            items.sort(key=lambda x: (x.published_at, x.id), reverse=True)
+            start = 0
+            if since is not None:
+                # (since,) sorts before every (since, id) key; skip those ties
+                start = self._index.bisect_left((since,))
+                while start < len(self._index) and self._index[start][0] == since:
+                    start += 1
+
+            stop = len(self._index)
+            if limit is not None:
+                start = max(start, stop - limit)
+
+            # Walk the index backwards: published_at DESC, then id DESC
+            keys = self._index.islice(start, stop, reverse=True)
+            items = [self._items[item_id] for _, item_id in keys]
             logger.info(f"Retrieved {len(items)} items")
             return items
 
@@ -97,6 +146,21 @@ class InMemoryStore(NewsStore):
                 logger.debug(f"Item not found: {item_id}")
             return item
 
+    async def get_many(self, item_ids: List[str]) -> List[Optional[NewsItem]]:
+        """Retrieve several news items by ID in a single operation.
+
+        Args:
+            item_ids: The unique identifiers of the news items
+
+        Returns:
+            List aligned with item_ids holding each item, or None if not found
+        """
+        async with self._lock:
+            items = [self._items.get(item_id) for item_id in item_ids]
+            found = sum(item is not None for item in items)
+            logger.debug(f"Retrieved {found}/{len(item_ids)} items by ID")
+            return items
+
     async def count(self) -> int:
         """Get the total number of news items in storage.
 
@@ -116,4 +180,5 @@ class InMemoryStore(NewsStore):
         async with self._lock:
             item_count = len(self._items)
             self._items.clear()
+            self._index.clear()
             logger.info(f"Cleared {item_count} items from storage")
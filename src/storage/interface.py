@@ -1,6 +1,7 @@
 """Abstract storage interface for the newsfeed system."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
 
 from src.models.news_item import NewsItem
@@ -37,16 +38,26 @@ class NewsStore(ABC):
         pass
 
     @abstractmethod
-    async def add_items(self, items: List[NewsItem]) -> int:
+    async def add_items(self, items: List[NewsItem], *, batch_size: int = 500) -> int:
         """Add multiple news items to storage.
 
         Args:
             items: List of news items to add
+            batch_size: Maximum number of items written per bulk operation
 
         Returns:
             Number of items successfully added (excluding duplicates)
 
+        Raises:
+            ValueError: If batch_size is smaller than 1
+
         Note:
+            - Must write through a single bulk path per batch (e.g. asyncpg
+              ``copy_records_to_table`` or ``executemany`` with
+              ``ON CONFLICT DO NOTHING``); per-item add_item calls are not
+              allowed here
+            - Batches need not be applied in one transaction; other
+              operations may run between them
             - Should handle duplicate detection efficiently
             - Should be thread-safe
             - Should log the operation with count
@@ -54,15 +65,27 @@ class NewsStore(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self) -> List[NewsItem]:
-        """Retrieve all news items from storage.
+    async def get_all(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[NewsItem]:
+        """Retrieve news items from storage, newest first.
+
+        Args:
+            since: Only return items published strictly after this time
+            limit: Maximum number of items to return (newest are kept)
 
         Returns:
-            List of all stored news items
+            List of matching stored news items
+
+        Raises:
+            ValueError: If limit is negative
 
         Note:
             - Should return items in consistent order (for deterministic
               testing)
+            - Should push the since/limit predicates down to the backend
+              (e.g. ``WHERE published_at > $1 ... LIMIT $2``) instead of
+              filtering a full scan
             - Should be thread-safe
             - Should log the operation
         """
@@ -84,6 +107,24 @@ class NewsStore(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many(self, item_ids: List[str]) -> List[Optional[NewsItem]]:
+        """Retrieve several news items by ID in a single operation.
+
+        Args:
+            item_ids: The unique identifiers of the news items
+
+        Returns:
+            List aligned with item_ids holding each item, or None if not found
+
+        Note:
+            - Must resolve all IDs in one round-trip (e.g. ``WHERE id = ANY($1)``
+              or Redis ``MGET``) rather than looping over get_by_id
+            - Should be thread-safe
+            - Should handle non-existent IDs gracefully
+        """
+        pass
+
     @abstractmethod
     async def count(self) -> int:
         """Get the total number of news items in storage.
@@ -1,74 +1,207 @@
 """Pytest configuration and shared fixtures."""
 
+import asyncio
+import hashlib
+import pickle
+import sys
+import types
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-from sentence_transformers import SentenceTransformer
 
-from src.api.main import app
-from src.sources import RSSSource
 
-# Global model cache to avoid repeated loading
-_model_cache = {}
-_rss_data_cache = {}
+class _StubReddit:
+    """Stand-in for praw.Reddit; tests patch it wherever a client is needed.
+
+    Mirrors the part of the client RedditSource touches on construction, so
+    building a source still works when Reddit credentials are set.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.read_only = False
+
+    def subreddit(self, display_name):
+        """Return a mock subreddit, as praw does lazily without a request."""
+        return Mock()
+
+
+# No test talks to Reddit, so skip the cost of importing praw at collection.
+# This must run before anything imports src.sources.reddit_source.
+_praw_stub = types.ModuleType("praw")
+_praw_stub.Reddit = _StubReddit
+sys.modules.setdefault("praw", _praw_stub)
+
+from src.api.main import app  # noqa: E402
+from src.filtering import FilterOrchestration  # noqa: E402
+from src.filters import KeywordFilter, SemanticFilter  # noqa: E402
+from src.filters.semantic_filter import DEFAULT_MODEL_NAME, load_model  # noqa: E402
+from src.registry import FilterRegistry  # noqa: E402
+from src.sources import MockNewsSource, RSSSource  # noqa: E402
+
+try:
+    import uvloop
+except ImportError:  # e.g. on Windows, where uvloop is unavailable
+    uvloop = None
+
+# Live feeds recorded (once) for the real RSS data fixtures
+RSS_FEEDS = {
+    "tomshardware": "https://www.tomshardware.com/feeds/all",
+    "arstechnica": "https://feeds.arstechnica.com/arstechnica/index",
+}
+
+# Weights used to score the real RSS data
+SCORING_WEIGHTS = {"keyword": 0.6, "semantic": 0.4}
+
+
+def pytest_addoption(parser):
+    """Register the opt-in flag for tests that need the network."""
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        default=False,
+        help="run tests marked 'live' and (re-)record the RSS feeds",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked 'live' unless --run-live is given."""
+    if config.getoption("--run-live"):
+        return
+    skip_live = pytest.mark.skip(reason="needs network, run with --run-live")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests and fixtures on uvloop instead of the default loop."""
+        return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture(scope="session")
 def cached_semantic_model():
     """Shared semantic model cache for all integration tests.
 
-    This fixture loads the sentence transformer model once and reuses it
-    across all tests, significantly speeding up integration tests.
+    This fixture returns the same process-wide model instance that
+    `SemanticFilter()` uses, so the model is loaded at most once per session
+    whether tests inject it explicitly or build filters with defaults.
     """
-    model_name = "all-MiniLM-L6-v2"
+    print(f"\n🔄 Loading semantic model '{DEFAULT_MODEL_NAME}' for tests...")
+    model = load_model(DEFAULT_MODEL_NAME)
+    # Pay the first-call warm-up cost here instead of in whichever test
+    # happens to encode first
+    model.encode(["warmup"] * 2, convert_to_numpy=True)
+    print("✅ Model loaded successfully!")
+    return model
 
-    if model_name not in _model_cache:
-        print(f"\n🔄 Loading semantic model '{model_name}' for integration tests...")
-        _model_cache[model_name] = SentenceTransformer(model_name)
-        print("✅ Model loaded successfully!")
 
-    return _model_cache[model_name]
+async def _recorded_feed(cache_dir: Path, name: str, url: str) -> Path:
+    """Return a local copy of an RSS feed, recording it on first use.
 
+    Args:
+        cache_dir: Directory holding the recorded feeds
+        name: Source name, used as the file name
+        url: Live feed URL to record from
 
-@pytest.fixture(scope="session")
-def cached_rss_data():
-    """Shared RSS data cache for all integration tests.
+    Returns:
+        Path to the recorded feed XML
+    """
+    path = cache_dir / f"{name}.xml"
+    if not path.exists():
+        print(f"\n📼 Recording RSS feed '{name}' from {url}")
+        async with httpx.AsyncClient(follow_redirects=True, timeout=30) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+        path.write_bytes(response.content)
+    return path
 
-    This fixture fetches RSS data once and reuses it across all tests,
-    avoiding repeated network requests.
+
+@pytest.fixture(scope="session")
+def cached_rss_data(request):
+    """Shared RSS data for all integration tests.
+
+    The raw feeds are recorded into the pytest cache directory on the first
+    run and replayed from disk afterwards, so later sessions need no network
+    and always see the same items. Recording only happens with `--run-live`;
+    without it, tests using this fixture are skipped until the feeds exist.
+    Run with `--cache-clear --run-live` to re-record. The fixture is
+    session-scoped, so the feeds are parsed once per session.
     """
-    cache_key = "rss_data"
+    cache_dir = Path(request.config.cache.mkdir("rss_feeds"))
+    recorded = all((cache_dir / f"{name}.xml").exists() for name in RSS_FEEDS)
+    if not recorded and not request.config.getoption("--run-live"):
+        pytest.skip("RSS feeds not recorded yet, run with --run-live")
+
+    async def fetch_rss_data():
+        # Record (first run only) both feeds concurrently
+        toms_path, ars_path = await asyncio.gather(
+            *(_recorded_feed(cache_dir, name, url) for name, url in RSS_FEEDS.items())
+        )
 
-    if cache_key not in _rss_data_cache:
-        print("\n🔄 Fetching RSS data for integration tests...")
+        # Parse the local copies through the real RSS sources
+        toms_hardware = RSSSource("tomshardware", str(toms_path), max_items=5)
+        ars_technica = RSSSource("arstechnica", str(ars_path), max_items=5)
 
-        # Use asyncio to run the async fetch in a synchronous context
-        import asyncio
+        # Get items from both sources concurrently
+        toms_items, ars_items = await asyncio.gather(
+            toms_hardware.fetch_items(), ars_technica.fetch_items()
+        )
 
-        async def fetch_rss_data():
-            # Fetch from both RSS sources
-            toms_hardware = RSSSource(
-                "tomshardware", "https://www.tomshardware.com/feeds/all", max_items=5
-            )
-            ars_technica = RSSSource(
-                "arstechnica",
-                "https://feeds.arstechnica.com/arstechnica/index",
-                max_items=5,
-            )
+        # Combine and return
+        return toms_items + ars_items
 
-            # Get items from both sources
-            toms_items = await toms_hardware.fetch_items()
-            ars_items = await ars_technica.fetch_items()
+    # Use asyncio to run the async fetch in a synchronous context
+    all_items = asyncio.run(fetch_rss_data())
 
-            # Combine and return
-            return toms_items + ars_items
+    print(f"✅ Loaded {len(all_items)} RSS items successfully!")
+    return all_items
 
-        # Run the async function and cache the result
-        all_items = asyncio.run(fetch_rss_data())
-        _rss_data_cache[cache_key] = all_items
 
-        print(f"✅ Fetched {len(all_items)} RSS items successfully!")
+@pytest.fixture(scope="session")
+def cached_mock_items():
+    """Items of a three-item MockNewsSource ("test-mock"), generated once.
+
+    Tests must treat the items as read-only; their timestamps are relative to
+    the start of the session.
+    """
+    return asyncio.run(MockNewsSource("test-mock", 3).fetch_items())
+
 
-    return _rss_data_cache[cache_key]
+@pytest.fixture(scope="session")
+def cached_scored_rss(request, cached_rss_data):
+    """Real RSS items scored by the filter orchestration, cached on disk.
+
+    The scored items are pickled into the pytest cache directory under a key
+    derived from the input items and the weights, so read-only tests reuse
+    them across sessions and only a change in the feed triggers re-scoring.
+    The semantic model is only loaded on a cache miss.
+    """
+    digest = hashlib.sha1(repr(sorted(SCORING_WEIGHTS.items())).encode())
+    for item in cached_rss_data:
+        digest.update(
+            f"{item.id}\0{item.version}\0{item.title}\0{item.body}\0".encode()
+        )
+    cache_path = (
+        Path(request.config.cache.mkdir("scored_rss")) / f"{digest.hexdigest()}.pkl"
+    )
+
+    if cache_path.exists():
+        return pickle.loads(cache_path.read_bytes())
+
+    registry = FilterRegistry()
+    registry.register(KeywordFilter())
+    model = request.getfixturevalue("cached_semantic_model")
+    registry.register(SemanticFilter(model=model))
+    orchestration = FilterOrchestration(registry, SCORING_WEIGHTS)
+
+    scored = asyncio.run(orchestration.apply_filters(cached_rss_data))
+    cache_path.write_bytes(pickle.dumps(scored))
+    return scored
 
 
 @pytest.fixture
@@ -1,11 +1,20 @@
 """Pytest configuration for integration tests."""
 
+import json
 import os
+from typing import AsyncIterator, Dict, List
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
 from src.api.main import app
+from src.api.routers.ingest import get_source_registry
+from src.models.news_item import NewsItem
+from src.registry import SourceRegistry
+from src.sources.mock_source import MockNewsSource
+from src.storage.in_memory import InMemoryStore
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -16,14 +25,111 @@ def set_test_mode():
     del os.environ["TESTING"]
 
 
-@pytest.fixture
-def client() -> TestClient:
+@pytest.fixture(scope="session")
+def mock_source_registry() -> SourceRegistry:
+    """Create a source registry holding only an in-memory mock source."""
+    registry = SourceRegistry()
+    registry.register(MockNewsSource("mock"))
+    return registry
+
+
+@pytest.fixture(scope="session")
+def client(set_test_mode, mock_source_registry) -> TestClient:
     """Create a test client for the FastAPI app in test mode.
 
     This fixture relies on the `set_test_mode` fixture to ensure that the
     application starts in a lightweight mode, without loading heavy models or
-    starting background services. This makes integration tests significantly
-    faster and more reliable.
+    starting background services. Endpoints that depend on the source
+    registry get `mock_source_registry`, so no request can reach the network.
+    The client is shared by the whole session, so the app lifespan runs once;
+    `reset_storage` keeps tests isolated.
     """
+    app.dependency_overrides[get_source_registry] = lambda: mock_source_registry
     with TestClient(app) as test_client:
         yield test_client
+    app.dependency_overrides.pop(get_source_registry, None)
+
+
+@pytest_asyncio.fixture
+async def aclient(client: TestClient) -> AsyncIterator[httpx.AsyncClient]:
+    """Async client that calls the app in-process through httpx's ASGITransport.
+
+    Requests run on the test's own event loop, without TestClient's worker
+    thread hop. ASGITransport does not run the app lifespan, so this builds on
+    the session `client`, which has already started the app.
+
+    The session app's storage lives on TestClient's portal loop, and its
+    asyncio lock cannot be contended from two loops. In test mode the store is
+    the only loop-bound component the lifespan creates, so for the duration of
+    the test the app gets a fresh store that only this loop ever touches.
+    """
+    app_state = client.app.state
+    portal_storage = app_state.storage
+    app_state.storage = InMemoryStore()
+    try:
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            yield ac
+    finally:
+        app_state.storage = portal_storage
+
+
+@pytest.fixture(autouse=True)
+def reset_storage(client: TestClient):
+    """Clear the shared app storage before each test."""
+    client.portal.call(client.app.state.storage.clear)
+
+
+@pytest.fixture(scope="session")
+def sample_news_items() -> List[Dict]:
+    """Raw news items in the JSON shape accepted by /ingest."""
+    return [
+        {
+            "id": "sample_001",
+            "source": "test",
+            "title": "Ransomware attack disrupts hospital systems",
+            "published_at": "2024-12-09T15:30:00Z",
+        },
+        {
+            "id": "sample_002",
+            "source": "test",
+            "title": "Critical Security Vulnerability in Apache Log4j",
+            "body": "A zero-day vulnerability allows remote code execution.",
+            "published_at": "2024-12-10T15:30:00Z",
+        },
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_news_items_bytes(sample_news_items) -> bytes:
+    """The sample /ingest request body, serialized once per session.
+
+    Post it with `content=` and a JSON Content-Type header instead of `json=`
+    so the payload is not re-encoded on every request.
+    """
+    return json.dumps({"items": sample_news_items}).encode()
+
+
+@pytest.fixture(scope="module")
+def ingested_snapshot(client, sample_news_items_bytes) -> List[NewsItem]:
+    """Ingest the sample payload once per module and snapshot the stored items."""
+    storage = client.app.state.storage
+    client.portal.call(storage.clear)
+    response = client.post(
+        "/api/v1/ingest",
+        content=sample_news_items_bytes,
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 200
+    return client.portal.call(storage.get_all)
+
+
+@pytest.fixture
+def ingested_client(client, ingested_snapshot) -> TestClient:
+    """Client whose storage holds the ingested sample items.
+
+    The items are ingested once per module; each test gets them restored into
+    the freshly cleared store, so read-only tests skip the ingest pipeline.
+    """
+    client.portal.call(client.app.state.storage.add_items, ingested_snapshot)
+    return client
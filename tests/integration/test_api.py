@@ -1,12 +1,23 @@
 """Integration tests for FastAPI endpoints."""
 
+import httpx
+import numpy as np
+import pytest
 from fastapi.testclient import TestClient
 
+from src.api.routers.retrieve import get_filter_registry
+from src.filters import KeywordFilter
+from src.registry import FilterRegistry
+
+# Headers for posting pre-serialized JSON bodies
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def test_root_endpoint(client: TestClient):
     """Test the root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
+    assert "application/json" in response.headers["content-type"]
     data = response.json()
     expected = {"message": "IT Newsfeed API", "docs": "/docs", "health": "/health"}
     # Check that all expected fields/values are present in the response
@@ -23,6 +34,7 @@ def test_health_endpoint(client: TestClient):
     response = client.get("/health")
 
     assert response.status_code == 200
+    assert "application/json" in response.headers["content-type"]
     data = response.json()
     assert "status" in data
     assert "dependencies" in data
@@ -32,17 +44,146 @@ def test_health_endpoint(client: TestClient):
     assert "sources" in data["dependencies"]
 
 
-def test_api_docs_available(client: TestClient):
-    """Test that OpenAPI docs are accessible."""
-    response = client.get("/docs")
+@pytest.mark.parametrize(
+    "path, expected_status, content_type",
+    [
+        ("/docs", 200, "text/html"),
+        ("/redoc", 200, "text/html"),
+        ("/api/v1/retrieve", 200, "application/json"),
+    ],
+)
+def test_smoke_endpoints(
+    client: TestClient, path: str, expected_status: int, content_type: str
+):
+    """Test that the remaining public GET endpoints respond with the expected type.
+
+    `/` and `/health` are checked in detail by their own tests.
+    """
+    response = client.get(path)
+
+    assert response.status_code == expected_status
+    assert content_type in response.headers["content-type"]
+
+
+async def test_retrieve_conditional_get(
+    aclient: httpx.AsyncClient, sample_news_items_bytes: bytes
+):
+    """Test that /retrieve answers a matching If-None-Match with 304."""
+    first = await aclient.get("/api/v1/retrieve")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    unchanged = await aclient.get("/api/v1/retrieve", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
 
+    await aclient.post(
+        "/api/v1/ingest", content=sample_news_items_bytes, headers=JSON_HEADERS
+    )
+
+    changed = await aclient.get("/api/v1/retrieve", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["total"] == 2
+
+
+async def test_retrieve_since(
+    aclient: httpx.AsyncClient, sample_news_items_bytes: bytes
+):
+    """Test that /retrieve only returns items published after `since`."""
+    await aclient.post(
+        "/api/v1/ingest", content=sample_news_items_bytes, headers=JSON_HEADERS
+    )
+
+    response = await aclient.get(
+        "/api/v1/retrieve", params={"since": "2024-12-09T15:30:00Z"}
+    )
     assert response.status_code == 200
-    assert "text/html" in response.headers["content-type"]
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == ["sample_002"]
+    assert data["filtering_info"]["total_items_in_storage"] == 2
+
+
+async def test_ingest_duplicate_items(
+    aclient: httpx.AsyncClient, sample_news_items_bytes: bytes
+):
+    """Test that re-ingesting the same batch reports every item as duplicate."""
+    first = await aclient.post(
+        "/api/v1/ingest", content=sample_news_items_bytes, headers=JSON_HEADERS
+    )
+    assert first.json()["summary"]["accepted"] == 2
 
+    second = await aclient.post(
+        "/api/v1/ingest", content=sample_news_items_bytes, headers=JSON_HEADERS
+    )
+    assert second.status_code == 200
+    summary = second.json()["summary"]
+    assert summary["duplicates"] == 2
+    assert summary["accepted"] == 0
 
-def test_alternative_docs_available(client: TestClient):
-    """Test that alternative OpenAPI docs are accessible."""
-    response = client.get("/redoc")
+
+def test_retrieve_response_structure(ingested_client: TestClient):
+    """Test the /retrieve payload shape once items are stored."""
+    response = ingested_client.get("/api/v1/retrieve")
 
     assert response.status_code == 200
-    assert "text/html" in response.headers["content-type"]
+    data = response.json()
+    assert set(data) >= {"items", "total", "filtering_info"}
+    assert data["total"] == len(data["items"]) == 2
+
+
+def test_retrieve_items_have_required_fields(ingested_client: TestClient):
+    """Test that every retrieved item carries the API contract fields."""
+    items = ingested_client.get("/api/v1/retrieve").json()["items"]
+
+    for item in items:
+        for field in ("id", "source", "title", "published_at"):
+            assert item[field]
+
+
+def test_retrieve_deterministic_results(ingested_client: TestClient):
+    """Test that repeated retrieves over the same data are identical."""
+    first = ingested_client.get("/api/v1/retrieve")
+    second = ingested_client.get("/api/v1/retrieve")
+
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+
+
+@pytest.fixture
+def keyword_ranked_client(client: TestClient):
+    """Client whose /retrieve ranks items with the real keyword filter."""
+    registry = FilterRegistry()
+    registry.register(KeywordFilter())
+    client.app.dependency_overrides[get_filter_registry] = lambda: registry
+    yield client
+    client.app.dependency_overrides.pop(get_filter_registry, None)
+
+
+@pytest.mark.parametrize("item_count", [10, 1000])
+def test_ingest_retrieve_ranking_order(
+    keyword_ranked_client: TestClient, item_count: int
+):
+    """Test that /retrieve returns items in non-increasing relevance order."""
+    titles = [
+        "Critical security vulnerability exploited by ransomware",
+        "Cloud outage after failed update",
+        "New database release improves performance",
+        "Server hardware refresh announced",
+    ]
+    items = [
+        {
+            "id": f"rank_{i:04d}",
+            "source": "test",
+            "title": titles[i % len(titles)],
+            "published_at": f"2024-12-{1 + i % 28:02d}T15:30:00Z",
+        }
+        for i in range(item_count)
+    ]
+    keyword_ranked_client.post("/api/v1/ingest", json={"items": items})
+
+    retrieved = keyword_ranked_client.get("/api/v1/retrieve").json()["items"]
+    assert len(retrieved) == item_count
+
+    scores = np.fromiter((item["relevance_score"] for item in retrieved), float)
+    assert np.all(np.diff(scores) <= 0)
@@ -0,0 +1,61 @@
+"""Integration tests against real RSS feed data.
+
+The feeds are recorded once (with ``--run-live``) into the pytest cache and
+replayed from disk afterwards; until they are recorded these tests are skipped.
+Tests marked ``live`` always go to the network and only run with ``--run-live``.
+"""
+
+import httpx
+import pytest
+
+from src.models.news_item import NewsItem
+from src.sources import RSSSource
+from tests.conftest import RSS_FEEDS, SCORING_WEIGHTS
+
+
+def test_real_rss_items_are_valid_news_items(cached_rss_data):
+    """Test recorded feeds parse into well-formed, uniquely identified items."""
+    assert cached_rss_data
+    assert all(isinstance(item, NewsItem) for item in cached_rss_data)
+    assert {item.source for item in cached_rss_data} <= set(RSS_FEEDS)
+    assert len({item.id for item in cached_rss_data}) == len(cached_rss_data)
+    assert all(item.published_at.tzinfo is not None for item in cached_rss_data)
+
+
+def test_real_rss_items_respect_max_items(cached_rss_data):
+    """Test each recorded feed contributes at most max_items items."""
+    for name in RSS_FEEDS:
+        assert sum(item.source == name for item in cached_rss_data) <= 5
+
+
+def test_real_rss_scored_once_per_item_in_order(cached_rss_data, cached_scored_rss):
+    """Test every recorded item gets exactly one score, in input order."""
+    assert [scored.item.id for scored in cached_scored_rss] == [
+        item.id for item in cached_rss_data
+    ]
+
+
+def test_real_rss_scores_combine_filter_weights(cached_scored_rss):
+    """Test final scores are the bounded weighted mean of the filter scores."""
+    total_weight = sum(SCORING_WEIGHTS.values())
+    for scored in cached_scored_rss:
+        breakdown = scored.score_breakdown
+        assert set(breakdown) == set(SCORING_WEIGHTS) | {"final"}
+        assert 0.0 <= scored.relevance_score <= 1.0
+        expected = (
+            sum(weight * breakdown[name] for name, weight in SCORING_WEIGHTS.items())
+            / total_weight
+        )
+        assert scored.relevance_score == pytest.approx(min(max(expected, 0.0), 1.0))
+
+
+@pytest.mark.live
+@pytest.mark.parametrize("name, url", list(RSS_FEEDS.items()), ids=list(RSS_FEEDS))
+async def test_live_feed_fetch(name, url):
+    """Test the real feeds are reachable and parse through a shared client."""
+    async with httpx.AsyncClient(follow_redirects=True, timeout=30) as client:
+        source = RSSSource(name, url, max_items=5, client=client)
+        items = await source.fetch_items()
+
+    assert 0 < len(items) <= 5
+    assert all(item.source == name for item in items)
@@ -0,0 +1,67 @@
+"""Shared fixtures for the unit tests.
+
+The mock Reddit posts and RSS feed objects below are module-scoped, so they
+are built once per test module instead of once per test. Tests must treat them
+as read-only; tests needing a variant build their own stub inline.
+
+The sources only read attributes from posts, entries and feeds, so plain
+SimpleNamespace stubs are used instead of Mock objects.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def _reddit_post(post_id: str, title: str, selftext: str) -> SimpleNamespace:
+    """Build a stub Reddit post as returned by praw."""
+    return SimpleNamespace(
+        id=post_id,
+        title=title,
+        selftext=selftext,
+        created_utc=1640995200,  # 2022-01-01 00:00:00 UTC
+    )
+
+
+def _rss_entry(entry_id: str, title: str, summary: str) -> SimpleNamespace:
+    """Build a stub RSS entry as returned by feedparser."""
+    return SimpleNamespace(
+        id=entry_id,
+        title=title,
+        summary=summary,
+        published_parsed=(2025, 1, 1, 12, 0, 0, 0, 0, 0),
+    )
+
+
+def _rss_feed(entries) -> SimpleNamespace:
+    """Build a stub parsed feed holding the given entries."""
+    return SimpleNamespace(entries=entries, bozo=False)
+
+
+@pytest.fixture(scope="module")
+def reddit_mock_posts():
+    """Two mock posts of the sysadmin subreddit."""
+    return [
+        _reddit_post("post1", "IT Issue 1", "Description 1"),
+        _reddit_post("post2", "IT Issue 2", "Description 2"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def rss_mock_entry():
+    """A single complete mock RSS entry."""
+    return _rss_entry("test-id", "Test Article", "Test summary")
+
+
+@pytest.fixture(scope="module")
+def rss_mock_feed(rss_mock_entry):
+    """A mock parsed feed holding rss_mock_entry only."""
+    return _rss_feed([rss_mock_entry])
+
+
+@pytest.fixture(scope="module")
+def rss_mock_feed_5_entries():
+    """A mock parsed feed holding five numbered entries."""
+    return _rss_feed(
+        [_rss_entry(f"id-{i}", f"Article {i}", f"Summary {i}") for i in range(5)]
+    )
@@ -1,13 +1,24 @@
 """Unit tests for the API models."""
 
+import json
 from datetime import datetime, timezone
+from typing import List
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from src.models.api import IngestRequest, RetrieveResponse
 from src.models.news_item import NewsItem
 
+NOW = datetime(2024, 12, 10, 15, 30, 0, tzinfo=timezone.utc)
+
+# Built once so every serialization test reuses the same compiled serializer
+INGEST_REQUEST_ADAPTER = TypeAdapter(IngestRequest)
+RETRIEVE_RESPONSE_ADAPTER = TypeAdapter(RetrieveResponse)
+
+# News item fields required by the assignment's API contract
+REQUIRED_NEWS_ITEM_FIELDS = {"id", "source", "title", "body", "published_at"}
+
 
 class TestIngestRequest:
     """Test cases for the IngestRequest model."""
@@ -15,13 +26,12 @@ class TestIngestRequest:
     def test_valid_ingest_request(self):
         """Test creating a valid IngestRequest with news items."""
         # Arrange
-        now = datetime.now(timezone.utc)
         news_item = NewsItem(
             id="test_001",
             source="reddit",
             title="Test News",
             body="Test body",
-            published_at=now,
+            published_at=NOW,
         )
 
         # Act
@@ -35,20 +45,19 @@ class TestIngestRequest:
     def test_multiple_items(self):
         """Test IngestRequest with multiple news items."""
         # Arrange
-        now = datetime.now(timezone.utc)
         item1 = NewsItem(
             id="test_001",
             source="reddit",
             title="First News",
             body="Test body",  # Include body to test with content
-            published_at=now,
+            published_at=NOW,
         )
         item2 = NewsItem(
             id="test_002",
             source="rss",
             title="Second News",
             # body omitted - test optional field behavior
-            published_at=now,
+            published_at=NOW,
         )
 
         # Act
@@ -70,23 +79,21 @@ class TestIngestRequest:
     def test_json_serialization(self):
         """Test JSON serialization of IngestRequest."""
         # Arrange
-        now = datetime(2024, 12, 10, 15, 30, 0, tzinfo=timezone.utc)
         news_item = NewsItem(
             id="test_001",
             source="reddit",
             title="Test News",
             body="Test body",
-            published_at=now,
+            published_at=NOW,
         )
         request = IngestRequest(items=[news_item])
 
         # Act
-        json_data = request.model_dump_json()
+        data = json.loads(INGEST_REQUEST_ADAPTER.dump_json(request))
 
         # Assert
-        assert '"items":' in json_data
-        assert '"id":"test_001"' in json_data
-        assert '"source":"reddit"' in json_data
+        assert data["items"][0]["id"] == "test_001"
+        assert data["items"][0]["source"] == "reddit"
 
 
 class TestRetrieveResponse:
@@ -95,13 +102,12 @@ class TestRetrieveResponse:
     def test_valid_retrieve_response(self):
         """Test creating a valid RetrieveResponse with items."""
         # Arrange
-        now = datetime.now(timezone.utc)
         news_item = NewsItem(
             id="test_001",
             source="reddit",
             title="Test News",
             body="Test body",
-            published_at=now,
+            published_at=NOW,
         )
 
         # Act
@@ -124,20 +130,19 @@ class TestRetrieveResponse:
     def test_multiple_items(self):
         """Test RetrieveResponse with multiple items."""
         # Arrange
-        now = datetime.now(timezone.utc)
         item1 = NewsItem(
             id="test_001",
             source="reddit",
             title="First News",
             # body omitted - test optional field behavior
-            published_at=now,
+            published_at=NOW,
         )
         item2 = NewsItem(
             id="test_002",
             source="rss",
             title="Second News",
             body="Second News body",
-            published_at=now,
+            published_at=NOW,
         )
 
         # Act
@@ -152,23 +157,21 @@ class TestRetrieveResponse:
     def test_json_serialization(self):
         """Test JSON serialization of RetrieveResponse."""
         # Arrange
-        now = datetime(2024, 12, 10, 15, 30, 0, tzinfo=timezone.utc)
         news_item = NewsItem(
             id="test_001",
             source="reddit",
             title="Test News",
             body="Test body",
-            published_at=now,
+            published_at=NOW,
         )
         response = RetrieveResponse(items=[news_item], total=1)
 
         # Act
-        json_data = response.model_dump_json()
+        data = json.loads(RETRIEVE_RESPONSE_ADAPTER.dump_json(response))
 
         # Assert
-        assert '"items":' in json_data
-        assert '"total":1' in json_data
-        assert '"id":"test_001"' in json_data
+        assert data["total"] == 1
+        assert data["items"][0]["id"] == "test_001"
 
 
 class TestAssignmentCompliance:
@@ -176,57 +179,17 @@ class TestAssignmentCompliance:
 
     def test_ingest_request_contract(self):
         """Test that IngestRequest matches assignment contract."""
-        # Arrange
-        now = datetime.now(timezone.utc)
-        news_item = NewsItem(
-            id="contract_test",
-            source="mock",
-            title="Contract Test",
-            body="Test body",
-            published_at=now,
-        )
-
-        # Act
-        request = IngestRequest(items=[news_item])
-
-        # Assert - Check structure matches assignment
-        assert hasattr(request, "items")
-        assert isinstance(request.items, list)
-        assert len(request.items) > 0
+        fields = IngestRequest.model_fields
 
-        # Check that items contain required fields
-        item = request.items[0]
-        assert hasattr(item, "id")
-        assert hasattr(item, "source")
-        assert hasattr(item, "title")
-        assert hasattr(item, "body")
-        assert hasattr(item, "published_at")
+        assert "items" in fields
+        assert fields["items"].annotation == List[NewsItem]
+        assert REQUIRED_NEWS_ITEM_FIELDS <= set(NewsItem.model_fields)
 
     def test_retrieve_response_contract(self):
         """Test that RetrieveResponse matches assignment contract."""
-        # Arrange
-        now = datetime.now(timezone.utc)
-        news_item = NewsItem(
-            id="contract_test",
-            source="mock",
-            title="Contract Test",
-            body="Test body",
-            published_at=now,
-        )
-
-        # Act
-        response = RetrieveResponse(items=[news_item], total=1)
+        fields = RetrieveResponse.model_fields
 
-        # Assert - Check structure matches assignment
-        assert hasattr(response, "items")
-        assert isinstance(response.items, list)
-        assert hasattr(response, "total")
-        assert isinstance(response.total, int)
-
-        # Check that items contain required fields
-        item = response.items[0]
-        assert hasattr(item, "id")
-        assert hasattr(item, "source")
-        assert hasattr(item, "title")
-        assert hasattr(item, "body")
-        assert hasattr(item, "published_at")
+        assert {"items", "total"} <= set(fields)
+        assert fields["items"].annotation == List[NewsItem]
+        assert fields["total"].annotation is int
+        assert REQUIRED_NEWS_ITEM_FIELDS <= set(NewsItem.model_fields)
@@ -1,21 +1,45 @@
 """Unit tests for FilterOrchestration."""
 
 from datetime import datetime, timezone
+from typing import Dict, List
 
 import pytest
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from src.filtering import FilterOrchestration
 from src.filters import KeywordFilter, SemanticFilter
 from src.models.news_item import NewsItem
 from src.registry import FilterRegistry
 
+NOW = datetime(2024, 12, 10, 15, 30, 0, tzinfo=timezone.utc)
+
+
+class ScoredItemShape(BaseModel):
+    """Structure every FilteredItem returned by the orchestration must have."""
+
+    model_config = ConfigDict(from_attributes=True, strict=True)
+
+    item: NewsItem
+    relevance_score: float
+    score_breakdown: Dict[str, float]
+
+
+# Validates a whole result list in one pydantic-core call, reporting the
+# index and field of any malformed item
+SCORED_ITEMS = TypeAdapter(List[ScoredItemShape])
+
 
 class TestFilterOrchestration:
     """Test FilterOrchestration functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def registry(self):
-        """Create a filter registry with test filters."""
+        """Create a filter registry with test filters, shared by all tests.
+
+        Filter construction (keyword compilation, topic embeddings) is done
+        once; tests needing other weights build their own orchestration on
+        top of it, and tests needing other filters use a fresh registry.
+        """
         registry = FilterRegistry()
         registry.register(KeywordFilter())
         registry.register(SemanticFilter())
@@ -23,7 +47,10 @@ class TestFilterOrchestration:
 
     @pytest.fixture
     def orchestration(self, registry):
-        """Create a filter orchestration with test weights."""
+        """Create a filter orchestration with test weights.
+
+        Kept per test since test_set_weights mutates it.
+        """
         weights = {"keyword": 0.6, "semantic": 0.4}
         return FilterOrchestration(registry, weights)
 
@@ -31,7 +58,7 @@ class TestFilterOrchestration:
     def test_items(self):
         """Create test news items."""
         return [
-            NewsItem(
+            NewsItem.model_construct(
                 id="test_001",
                 source="test",
                 title=("Critical security vulnerability discovered"),
@@ -39,28 +66,27 @@ class TestFilterOrchestration:
                     "A major security breach has been reported affecting "
                     "multiple systems."
                 ),
-                published_at=datetime.now(timezone.utc),
+                published_at=NOW,
                 version=1,
             ),
-            NewsItem(
+            NewsItem.model_construct(
                 id="test_002",
                 source="test",
                 title="New software update available",
                 body="Latest version includes performance improvements and bug fixes.",
-                published_at=datetime.now(timezone.utc),
+                published_at=NOW,
                 version=1,
             ),
-            NewsItem(
+            NewsItem.model_construct(
                 id="test_003",
                 source="test",
                 title="Weather forecast for tomorrow",
                 body="Sunny skies expected with temperatures in the mid-70s.",
-                published_at=datetime.now(timezone.utc),
+                published_at=NOW,
                 version=1,
             ),
         ]
 
-    @pytest.mark.asyncio
     async def test_orchestration_initialization(self, registry):
         """Test orchestration initialization with registry and weights."""
         weights = {"keyword": 0.7, "semantic": 0.3}
@@ -69,7 +95,6 @@ class TestFilterOrchestration:
         assert orchestration.registry == registry
         assert orchestration.weights == weights
 
-    @pytest.mark.asyncio
     async def test_orchestration_no_weights(self, registry):
         """Test orchestration initialization without weights."""
         orchestration = FilterOrchestration(registry)
@@ -77,12 +102,12 @@ class TestFilterOrchestration:
         assert orchestration.registry == registry
         assert orchestration.weights == {}
 
-    @pytest.mark.asyncio
     async def test_apply_filters_with_items(self, orchestration, test_items):
         """Test applying filters to news items."""
         results = await orchestration.apply_filters(test_items)
 
         assert len(results) == 3
+        SCORED_ITEMS.validate_python(results, from_attributes=True)
 
         # Security item should have highest score
         security_item = next(r for r in results if "security" in r.item.title.lower())
@@ -90,26 +115,24 @@ class TestFilterOrchestration:
 
         assert security_item.relevance_score > weather_item.relevance_score
 
-    @pytest.mark.asyncio
     async def test_apply_filters_empty_input(self, orchestration):
         """Test applying filters to empty input."""
         results = await orchestration.apply_filters([])
 
         assert len(results) == 0
 
-    @pytest.mark.asyncio
     async def test_apply_filters_no_registry_filters(self):
         """Test applying filters when no filters are registered."""
         # Use a fresh registry with no filters
         registry = FilterRegistry()
         orchestration = FilterOrchestration(registry)
         test_items = [
-            NewsItem(
+            NewsItem.model_construct(
                 id="test_001",
                 source="test",
                 title="Test item",
                 body="Test content",
-                published_at=datetime.now(timezone.utc),
+                published_at=NOW,
                 version=1,
             )
         ]
@@ -117,10 +140,10 @@ class TestFilterOrchestration:
         results = await orchestration.apply_filters(test_items)
 
         assert len(results) == 1
+        SCORED_ITEMS.validate_python(results, from_attributes=True)
         assert results[0].relevance_score == 0.5  # Default score
         assert results[0].score_breakdown == {"default": 0.5}
 
-    @pytest.mark.asyncio
     async def test_score_breakdown(self, orchestration, test_items):
         """Test getting detailed score breakdown."""
         item = test_items[0]  # Security item
@@ -137,7 +160,18 @@ class TestFilterOrchestration:
 
         assert orchestration.weights == new_weights
 
-    @pytest.mark.asyncio
+    def test_weights_cannot_be_changed_in_place(self, orchestration):
+        """Test weights only change through the setter, not by mutation."""
+        weights = {"keyword": 0.8, "semantic": 0.2}
+        orchestration.set_weights(weights)
+
+        with pytest.raises(TypeError):
+            orchestration.weights["keyword"] = 0.5
+        weights["keyword"] = 0.5
+
+        assert orchestration.weights == {"keyword": 0.8, "semantic": 0.2}
+        assert orchestration._weight_vector.tolist() == [0.8, 0.2]
+
     async def test_weighted_scoring(self, registry):
         """Test that weights are properly applied in scoring."""
         # Create orchestration with different weights
@@ -145,12 +179,12 @@ class TestFilterOrchestration:
         orchestration = FilterOrchestration(registry, weights)
 
         test_items = [
-            NewsItem(
+            NewsItem.model_construct(
                 id="test_001",
                 source="test",
                 title="Security vulnerability critical",
                 body="Major security issue discovered.",
-                published_at=datetime.now(timezone.utc),
+                published_at=NOW,
                 version=1,
             )
         ]
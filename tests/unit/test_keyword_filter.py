@@ -0,0 +1,79 @@
+"""Unit tests for the keyword filter's keyword matching."""
+
+import random
+import re
+
+import pytest
+
+from src.filters.keyword_filter import KeywordFilter
+
+OVERLAPPING_KEYWORDS = {
+    "microsoft",
+    "microsoft azure",
+    "microsoft azure ad",
+    "azure",
+    "data",
+    "database",
+    "cloud",
+}
+
+
+def _count_each_keyword(text: str, keywords: set) -> int:
+    """Count matches the reference way, searching for every keyword separately."""
+    return sum(
+        len(re.findall(rf"\b{re.escape(keyword)}\b", text)) for keyword in keywords
+    )
+
+
+@pytest.fixture(scope="module")
+def keyword_filter():
+    """Provide a keyword filter; the matching helpers are stateless."""
+    return KeywordFilter()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("microsoft azure ad outage", 4),
+        ("microsoft azure and microsoft", 4),
+        ("database and data in the cloud", 3),
+        ("microsoftazure databases", 0),
+    ],
+)
+def test_count_overlapping_keywords(keyword_filter, text, expected):
+    """Test keywords sharing a start position are each counted."""
+    patterns = keyword_filter._compile_keywords(OVERLAPPING_KEYWORDS)
+
+    assert keyword_filter._count_keywords(text, patterns) == expected
+    assert expected == _count_each_keyword(text, OVERLAPPING_KEYWORDS)
+
+
+def test_count_matches_per_keyword_search(keyword_filter):
+    """Test tier counts agree with searching for each keyword separately."""
+    rng = random.Random(0)
+    tiers = [
+        (keyword_filter.high_priority_keywords, keyword_filter._high_matchers),
+        (keyword_filter.medium_priority_keywords, keyword_filter._medium_matchers),
+        (keyword_filter.low_priority_keywords, keyword_filter._low_matchers),
+        (OVERLAPPING_KEYWORDS, keyword_filter._compile_keywords(OVERLAPPING_KEYWORDS)),
+    ]
+    vocabulary = sorted(set().union(*(keywords for keywords, _ in tiers))) + [
+        "the",
+        "new",
+        "databases",
+        "hacker",
+    ]
+
+    for _ in range(200):
+        text = " ".join(rng.choices(vocabulary, k=12))
+        for keywords, patterns in tiers:
+            assert keyword_filter._count_keywords(
+                text, patterns
+            ) == _count_each_keyword(text, keywords)
+
+
+def test_builtin_tiers_compile_to_single_matcher(keyword_filter):
+    """Test the built-in keyword sets still need one scan per tier."""
+    assert len(keyword_filter._high_matchers) == 1
+    assert len(keyword_filter._medium_matchers) == 1
+    assert len(keyword_filter._low_matchers) == 1
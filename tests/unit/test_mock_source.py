@@ -2,8 +2,6 @@
 
 from datetime import datetime, timezone
 
-import pytest
-
 from src.sources import MockNewsSource
 
 
@@ -24,41 +22,31 @@ class TestMockNewsSource:
         assert source.name == "mock"
         assert source._item_count == 10
 
-    @pytest.mark.asyncio
-    async def test_fetch_items(self):
+    def test_fetch_items(self, cached_mock_items):
         """Test fetching mock news items."""
-        source = MockNewsSource("test-mock", 3)
-
-        items = await source.fetch_items()
+        assert len(cached_mock_items) == 3
+        assert all(item.source == "test-mock" for item in cached_mock_items)
+        assert all(item.version == 1 for item in cached_mock_items)
 
-        assert len(items) == 3
-        assert all(item.source == "test-mock" for item in items)
-        assert all(item.version == 1 for item in items)
-
-    @pytest.mark.asyncio
-    async def test_fetch_items_content(self):
+    def test_fetch_items_content(self, cached_mock_items):
         """Test that fetched items have proper content."""
-        source = MockNewsSource("test-mock", 1)
-
-        items = await source.fetch_items()
-
-        assert len(items) == 1
-        item = items[0]
+        it_keywords = ["vulnerability", "security", "outage", "CVE", "patch"]
 
-        # Check required fields
-        assert item.id.startswith("test-mock_")
-        assert item.title
-        assert item.body
-        assert item.published_at.tzinfo is not None  # timezone-aware
+        for item in cached_mock_items:
+            # Check required fields
+            assert item.id.startswith("test-mock_")
+            assert item.title
+            assert item.body
+            assert item.published_at.tzinfo is not None  # timezone-aware
 
-        # Check content is IT-relevant
-        it_keywords = ["vulnerability", "security", "outage", "CVE", "patch"]
-        content = f"{item.title} {item.body}".lower()
-        assert any(keyword in content for keyword in it_keywords)
+            # Check content is IT-relevant
+            content = f"{item.title} {item.body}".lower()
+            assert any(keyword in content for keyword in it_keywords)
 
-    @pytest.mark.asyncio
     async def test_fetch_items_timestamps(self):
         """Test that timestamps are properly set."""
+        # Needs wall-clock bounds around its own fetch, so it does not use the
+        # session-scoped items
         source = MockNewsSource("test-mock", 2)
 
         before_fetch = datetime.now(timezone.utc)
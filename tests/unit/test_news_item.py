@@ -11,59 +11,59 @@ from pydantic import ValidationError
 
 from src.models.news_item import NewsItem
 
+NOW = datetime(2024, 12, 10, 15, 30, 0, tzinfo=timezone.utc)
+
 
 class TestNewsItem:
     def test_valid_news_item_creation(self):
         """Test creating a valid NewsItem with all required fields."""
-        now = datetime.now(timezone.utc)
         news_item = NewsItem(
             id="test_001",
             source="reddit",
             title="Test Security Vulnerability",
             body="This is a test security issue",
-            published_at=now,
+            published_at=NOW,
             version=1,
         )
         assert news_item.id == "test_001"
         assert news_item.source == "reddit"
         assert news_item.title == "Test Security Vulnerability"
         assert news_item.body == "This is a test security issue"
-        assert news_item.published_at == now
+        assert news_item.published_at == NOW
         assert news_item.version == 1
 
-    def test_required_fields_validation(self):
+    @pytest.mark.parametrize(
+        "kwargs, field",
+        [
+            (dict(id="", source="reddit", title="Test", published_at=NOW), "id"),
+            (dict(id="test", source="", title="Test", published_at=NOW), "source"),
+            (dict(id="test", source="reddit", title="", published_at=NOW), "title"),
+            (
+                dict(
+                    id="test",
+                    source="reddit",
+                    title="Test",
+                    published_at=NOW.replace(tzinfo=None),  # naive
+                ),
+                "published_at",
+            ),
+        ],
+        ids=["empty-id", "empty-source", "empty-title", "naive-published-at"],
+    )
+    def test_required_fields_validation(self, kwargs, field):
         """Test that missing or empty required fields raise ValidationError."""
-        now = datetime.now(timezone.utc)
-        with pytest.raises(ValidationError):
-            NewsItem(id="", source="reddit", title="Test", body="", published_at=now)
-        with pytest.raises(ValidationError):
-            NewsItem(id="test", source="", title="Test", body="", published_at=now)
-        with pytest.raises(ValidationError):
-            NewsItem(id="test", source="reddit", title="", body="", published_at=now)
-        with pytest.raises(ValidationError):
-            NewsItem(
-                id="test",
-                source="reddit",
-                title="Test",
-                body="",
-                published_at=datetime.now(),  # naive
-            )
-        with pytest.raises(ValidationError):
-            NewsItem(id="", source="reddit", title="Test", body="", published_at=now)
-        with pytest.raises(ValidationError):
-            NewsItem(id="test", source="", title="Test", body="", published_at=now)
-        with pytest.raises(ValidationError):
-            NewsItem(id="test", source="reddit", title="", body="", published_at=now)
+        with pytest.raises(ValidationError) as exc_info:
+            NewsItem(body="", **kwargs)
+        assert [error["loc"] for error in exc_info.value.errors()] == [(field,)]
 
     def test_json_contract_compliance(self):
         """Test JSON serialization produces assignment-compliant format."""
-        now = datetime(2024, 12, 10, 15, 30, 0, tzinfo=timezone.utc)
         news_item = NewsItem(
             id="test_009",
             source="reddit",
             title="Test Serialization",
             body="Test body content",
-            published_at=now,
+            published_at=NOW,
             version=2,
         )
         expected = {
@@ -76,3 +76,35 @@ class TestNewsItem:
         }
         actual = news_item.model_dump(mode="json", exclude_none=True)
         assert actual == expected
+
+    def test_normalized_text_is_cached_and_not_serialized(self):
+        """Test normalized_text combines title/body and stays out of the JSON."""
+        news_item = NewsItem(
+            id="test_010",
+            source="rss",
+            title="Critical Patch",
+            body="Apply NOW",
+            published_at=NOW,
+        )
+
+        assert news_item.normalized_text == "critical patch apply now"
+        assert news_item.normalized_text is news_item.normalized_text
+        assert "normalized_text" not in news_item.model_dump()
+
+    def test_normalized_text_follows_title_and_body_updates(self):
+        """Test normalized_text is rebuilt after the title or body changes."""
+        news_item = NewsItem(
+            id="test_011",
+            source="rss",
+            title="Old Title",
+            body="Old body",
+            published_at=NOW,
+        )
+        assert news_item.normalized_text == "old title old body"
+
+        news_item.title = "New Title"
+        assert news_item.normalized_text == "new title old body"
+
+        copied = news_item.model_copy(update={"body": "New body"})
+        assert copied.normalized_text == "new title new body"
+        assert news_item.normalized_text == "new title old body"
@@ -1,6 +1,14 @@
 """Unit tests for registry pattern classes."""
 
-from src.registry import FilterRegistry, NewsFilter, NewsSource, SourceRegistry
+import pytest
+
+from src.registry import (
+    FilteredItem,
+    FilterRegistry,
+    NewsFilter,
+    NewsSource,
+    SourceRegistry,
+)
 
 
 class MockNewsSource(NewsSource):
@@ -28,8 +36,6 @@ class MockNewsFilter(NewsFilter):
         return self._name
 
     async def filter(self, items):
-        from src.registry import FilteredItem
-
         return [
             FilteredItem(item=item, relevance_score=1.0, score_breakdown={"mock": 1.0})
             for item in items
@@ -39,84 +45,65 @@ class MockNewsFilter(NewsFilter):
         return {"mock": 1.0}
 
 
-class TestSourceRegistry:
-    """Test cases for SourceRegistry class."""
-
-    def test_init(self):
-        """Test registry initialization."""
-        registry = SourceRegistry()
-        assert registry.count() == 0
-        assert registry.list_sources() == []
-
-    def test_register_source(self):
-        """Test registering a single source."""
-        registry = SourceRegistry()
-        source = MockNewsSource("test-source")
-
-        registry.register(source)
-
-        assert registry.count() == 1
-        assert registry.has_source("test-source")
-        assert registry.list_sources() == ["test-source"]
-
-    def test_get_source(self):
-        """Test retrieving a source by name."""
-        registry = SourceRegistry()
-        source = MockNewsSource("test-source")
-        registry.register(source)
-
-        retrieved = registry.get_source("test-source")
-
-        assert retrieved is source
-        assert retrieved is not None
-        assert retrieved.name == "test-source"
-
-    def test_get_source_not_found(self):
-        """Test retrieving a non-existent source."""
-        registry = SourceRegistry()
-
-        retrieved = registry.get_source("non-existent")
-
-        assert retrieved is None
-
-
-class TestFilterRegistry:
-    """Test cases for FilterRegistry class."""
-
-    def test_init(self):
+REGISTRY_CASES = [
+    pytest.param(
+        SourceRegistry,
+        MockNewsSource,
+        "list_sources",
+        "has_source",
+        "get_source",
+        id="source",
+    ),
+    pytest.param(
+        FilterRegistry,
+        MockNewsFilter,
+        "list_filters",
+        "has_filter",
+        "get_filter",
+        id="filter",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "registry_cls, component_cls, list_fn, has_fn, get_fn", REGISTRY_CASES
+)
+class TestRegistry:
+    """Test cases shared by SourceRegistry and FilterRegistry."""
+
+    def test_init(self, registry_cls, component_cls, list_fn, has_fn, get_fn):
         """Test registry initialization."""
-        registry = FilterRegistry()
+        registry = registry_cls()
         assert registry.count() == 0
-        assert registry.list_filters() == []
+        assert getattr(registry, list_fn)() == []
 
-    def test_register_filter(self):
-        """Test registering a single filter."""
-        registry = FilterRegistry()
-        filter_component = MockNewsFilter("test-filter")
+    def test_register(self, registry_cls, component_cls, list_fn, has_fn, get_fn):
+        """Test registering a single component."""
+        registry = registry_cls()
+        component = component_cls("test-component")
 
-        registry.register(filter_component)
+        registry.register(component)
 
         assert registry.count() == 1
-        assert registry.has_filter("test-filter")
-        assert registry.list_filters() == ["test-filter"]
+        assert getattr(registry, has_fn)("test-component")
+        assert getattr(registry, list_fn)() == ["test-component"]
 
-    def test_get_filter(self):
-        """Test retrieving a filter by name."""
-        registry = FilterRegistry()
-        filter_component = MockNewsFilter("test-filter")
-        registry.register(filter_component)
+    def test_get(self, registry_cls, component_cls, list_fn, has_fn, get_fn):
+        """Test retrieving a component by name."""
+        registry = registry_cls()
+        component = component_cls("test-component")
+        registry.register(component)
 
-        retrieved = registry.get_filter("test-filter")
+        retrieved = getattr(registry, get_fn)("test-component")
 
-        assert retrieved is filter_component
-        assert retrieved is not None
-        assert retrieved.name == "test-filter"
+        assert retrieved is component
+        assert retrieved.name == "test-component"
 
-    def test_get_filter_not_found(self):
-        """Test retrieving a non-existent filter."""
-        registry = FilterRegistry()
+    def test_get_not_found(self, registry_cls, component_cls, list_fn, has_fn, get_fn):
+        """Test retrieving a non-existent component."""
+        registry = registry_cls()
 
-        retrieved = registry.get_filter("non-existent")
+        retrieved = getattr(registry, get_fn)("non-existent")
 
         assert retrieved is None
 
@@ -1,143 +1,214 @@
 """Unit tests for RSSSource."""
 
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import feedparser
+import httpx
 import pytest
 
 from src.sources import RSSSource
 
+FEED_URL = "https://example.com/feed.xml"
+
+RSS_DOCUMENT = (
+    b'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>'
+    b"<item><title>Test Article</title><guid>test-id</guid>"
+    b"<description>Test summary</description>"
+    b"<pubDate>Wed, 01 Jan 2025 12:00:00 GMT</pubDate></item>"
+    b"</channel></rss>"
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_feedparser():
+    """Patch feedparser in the RSS source once for the whole module."""
+    with patch("src.sources.rss_source.feedparser") as mock_feedparser:
+        yield mock_feedparser
+
+
+@pytest.fixture(autouse=True)
+def reset_feedparser(mock_feedparser):
+    """Forget the previous test's parse result, so tests stay isolated."""
+    mock_feedparser.parse.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def real_feedparser(mock_feedparser):
+    """Parse with the real feedparser, for tests serving actual RSS bytes."""
+    mock_feedparser.parse.side_effect = feedparser.parse
+
 
 class TestRSSSource:
     """Test RSSSource functionality."""
 
-    def test_rss_source_initialization(self):
+    @pytest.fixture
+    def make_rss(self):
+        """Factory for RSSSources reading the test feed."""
+
+        def _make(max_items: int = 10, client=None) -> RSSSource:
+            # No backoff delay, so retry tests do not sleep
+            return RSSSource(
+                "test-rss", FEED_URL, max_items, client=client, retry_backoff=0
+            )
+
+        return _make
+
+    def test_rss_source_initialization(self, make_rss):
         """Test RSSSource initialization."""
-        source = RSSSource("test-rss", "https://example.com/feed.xml", 5)
+        source = make_rss(5)
 
         assert source.name == "test-rss"
-        assert source._feed_url == "https://example.com/feed.xml"
+        assert source._feed_url == FEED_URL
         assert source._max_items == 5
 
-    @pytest.mark.asyncio
-    async def test_fetch_items_success(self):
-        """Test successful RSS feed fetching."""
-        # Mock feedparser response
-        mock_entry = MagicMock()
-        mock_entry.title = "Test Article"
-        mock_entry.summary = "Test summary"
-        mock_entry.published_parsed = (2025, 1, 1, 12, 0, 0, 0, 0, 0)
-        mock_entry.id = "test-id"
+    def test_rss_source_rejects_negative_max_retries(self):
+        """Test a negative retry count is rejected up front."""
+        with pytest.raises(ValueError):
+            RSSSource("test-rss", FEED_URL, max_retries=-1)
 
-        mock_feed = MagicMock()
-        mock_feed.entries = [mock_entry]
-        mock_feed.bozo = False
-
-        with patch("src.sources.rss_source.feedparser") as mock_feedparser:
-            mock_feedparser.parse.return_value = mock_feed
+    async def test_fetch_items_success(self, make_rss, rss_mock_feed, mock_feedparser):
+        """Test successful RSS feed fetching."""
+        mock_feedparser.parse.return_value = rss_mock_feed
 
-            source = RSSSource("test-rss", "https://example.com/feed.xml")
-            items = await source.fetch_items()
+        source = make_rss()
+        items = await source.fetch_items()
 
-            assert len(items) == 1
-            assert items[0].title == "Test Article"
-            assert items[0].body == "Test summary"
-            assert items[0].source == "test-rss"
-            assert items[0].id == "test-rss_test-id"
+        assert len(items) == 1
+        assert items[0].title == "Test Article"
+        assert items[0].body == "Test summary"
+        assert items[0].source == "test-rss"
+        assert items[0].id == "test-rss_test-id"
 
-    @pytest.mark.asyncio
-    async def test_fetch_items_empty_feed(self):
+    async def test_fetch_items_empty_feed(self, make_rss, mock_feedparser):
         """Test handling of empty RSS feed."""
-        mock_feed = MagicMock()
-        mock_feed.entries = []
+        mock_feedparser.parse.return_value = SimpleNamespace(entries=[])
 
-        with patch("src.sources.rss_source.feedparser") as mock_feedparser:
-            mock_feedparser.parse.return_value = mock_feed
+        source = make_rss()
+        items = await source.fetch_items()
 
-            source = RSSSource("test-rss", "https://example.com/feed.xml")
-            items = await source.fetch_items()
-
-            assert len(items) == 0
+        assert len(items) == 0
 
-    @pytest.mark.asyncio
-    async def test_fetch_items_parsing_error(self):
+    async def test_fetch_items_parsing_error(self, make_rss, mock_feedparser):
         """Test handling of RSS parsing errors."""
-        with patch("src.sources.rss_source.feedparser") as mock_feedparser:
-            mock_feedparser.parse.side_effect = Exception("Network error")
+        mock_feedparser.parse.side_effect = Exception("Network error")
 
-            source = RSSSource("test-rss", "https://example.com/feed.xml")
-            items = await source.fetch_items()
+        source = make_rss()
+        items = await source.fetch_items()
 
-            assert len(items) == 0
+        assert len(items) == 0
 
-    @pytest.mark.asyncio
-    async def test_fetch_items_max_items_limit(self):
+    async def test_fetch_items_max_items_limit(
+        self, make_rss, rss_mock_feed_5_entries, mock_feedparser
+    ):
         """Test that max_items limit is respected."""
-        # Create multiple mock entries
-        mock_entries = []
-        for i in range(5):
-            entry = MagicMock()
-            entry.title = f"Article {i}"
-            entry.summary = f"Summary {i}"
-            entry.published_parsed = (2025, 1, 1, 12, 0, 0, 0, 0, 0)
-            entry.id = f"id-{i}"
-            mock_entries.append(entry)
-
-        mock_feed = MagicMock()
-        mock_feed.entries = mock_entries
-        mock_feed.bozo = False
-
-        with patch("src.sources.rss_source.feedparser") as mock_feedparser:
-            mock_feedparser.parse.return_value = mock_feed
-
-            # Test with max_items=3
-            source = RSSSource("test-rss", "https://example.com/feed.xml", max_items=3)
-            items = await source.fetch_items()
+        mock_feedparser.parse.return_value = rss_mock_feed_5_entries
 
-            assert len(items) == 3
-            assert items[0].title == "Article 0"
-            assert items[1].title == "Article 1"
-            assert items[2].title == "Article 2"
+        # Test with max_items=3
+        source = make_rss(max_items=3)
+        items = await source.fetch_items()
 
-    @pytest.mark.asyncio
-    async def test_fetch_items_missing_title(self):
+        assert len(items) == 3
+        assert items[0].title == "Article 0"
+        assert items[1].title == "Article 1"
+        assert items[2].title == "Article 2"
+
+    async def test_fetch_items_missing_title(self, make_rss, mock_feedparser):
         """Test handling of entries without title."""
-        mock_entry = MagicMock()
-        mock_entry.title = ""  # Missing title
-        mock_entry.summary = "Test summary"
+        mock_entry = SimpleNamespace(title="", summary="Test summary")  # No title
+
+        mock_feedparser.parse.return_value = SimpleNamespace(
+            entries=[mock_entry], bozo=False
+        )
 
-        mock_feed = MagicMock()
-        mock_feed.entries = [mock_entry]
-        mock_feed.bozo = False
+        source = make_rss()
+        items = await source.fetch_items()
 
-        with patch("src.sources.rss_source.feedparser") as mock_feedparser:
-            mock_feedparser.parse.return_value = mock_feed
+        assert len(items) == 0  # Should skip entries without title
 
-            source = RSSSource("test-rss", "https://example.com/feed.xml")
+    async def test_id_generation_with_link(self, make_rss, mock_feedparser):
+        """Test ID generation using link when ID is not available."""
+        mock_entry = SimpleNamespace(
+            title="Test Article",
+            summary="Test summary",
+            published_parsed=(2025, 1, 1, 12, 0, 0, 0, 0, 0),
+            id=None,  # No ID
+            link="https://example.com/article",
+        )
+
+        mock_feedparser.parse.return_value = SimpleNamespace(
+            entries=[mock_entry], bozo=False
+        )
+
+        source = make_rss()
+        items = await source.fetch_items()
+
+        assert len(items) == 1
+        # Should generate ID from link hash
+        assert items[0].id.startswith("test-rss_")
+        assert len(items[0].id) > len("test-rss_")
+
+    async def test_fetch_items_with_shared_client(self, make_rss, real_feedparser):
+        """Test that an injected HTTP client downloads the feed."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(200, content=RSS_DOCUMENT)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            source = make_rss(client=client)
             items = await source.fetch_items()
 
-            assert len(items) == 0  # Should skip entries without title
+        assert requested == [FEED_URL]
+        assert len(items) == 1
+        assert items[0].title == "Test Article"
+        assert items[0].id == "test-rss_test-id"
+        assert items[0].published_at == datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
 
-    @pytest.mark.asyncio
-    async def test_id_generation_with_link(self):
-        """Test ID generation using link when ID is not available."""
-        mock_entry = MagicMock()
-        mock_entry.title = "Test Article"
-        mock_entry.summary = "Test summary"
-        mock_entry.published_parsed = (2025, 1, 1, 12, 0, 0, 0, 0, 0)
-        mock_entry.id = None  # No ID
-        mock_entry.link = "https://example.com/article"
+    async def test_fetch_items_retries_transient_errors(
+        self, make_rss, real_feedparser
+    ):
+        """Test that transient failures are retried before succeeding."""
+        responses = iter([httpx.ConnectError("reset"), httpx.Response(429)])
 
-        mock_feed = MagicMock()
-        mock_feed.entries = [mock_entry]
-        mock_feed.bozo = False
+        def handler(request: httpx.Request) -> httpx.Response:
+            outcome = next(responses, httpx.Response(200, content=RSS_DOCUMENT))
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
 
-        with patch("src.sources.rss_source.feedparser") as mock_feedparser:
-            mock_feedparser.parse.return_value = mock_feed
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            items = await make_rss(client=client).fetch_items()
 
-            source = RSSSource("test-rss", "https://example.com/feed.xml")
+        assert [item.title for item in items] == ["Test Article"]
+
+    async def test_fetch_items_with_shared_client_http_error(self, make_rss):
+        """Test that HTTP errors from the shared client yield no items."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request)
+            return httpx.Response(503)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            source = make_rss(client=client)
             items = await source.fetch_items()
 
-            assert len(items) == 1
-            # Should generate ID from link hash
-            assert items[0].id.startswith("test-rss_")
-            assert len(items[0].id) > len("test-rss_")
+        assert items == []
+        assert len(requested) == 3  # First attempt plus two retries
+
+    async def test_fetch_items_does_not_retry_client_errors(self, make_rss):
+        """Test that non-transient HTTP errors fail without retrying."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request)
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            items = await make_rss(client=client).fetch_items()
+
+        assert items == []
+        assert len(requested) == 1
@@ -1,5 +1,6 @@
 """Unit tests for the storage implementations."""
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -8,37 +9,78 @@ import pytest_asyncio
 from src.models.news_item import NewsItem
 from src.storage.in_memory import InMemoryStore
 
+NOW = datetime(2024, 12, 10, 15, 30, 0, tzinfo=timezone.utc)
+
+# Built once per module and shared read-only (the store keeps references,
+# so tests must not mutate these items); test data is already well-formed,
+# so model_construct skips validation
+_SAMPLE_ITEMS = tuple(
+    NewsItem.model_construct(
+        id=f"test_{i:03d}",
+        source="reddit",
+        title=f"Test Item {i}",
+        body=f"Test body for item {i}",
+        published_at=NOW,
+    )
+    for i in range(1, 4)
+)
+
+# One older and one newer item, for ordering checks
+_OLDER_NEWER_ITEMS = (
+    NewsItem.model_construct(
+        id="test_001",
+        source="reddit",
+        title="Older Item",
+        body="Older item body",
+        published_at=NOW,
+    ),
+    NewsItem.model_construct(
+        id="test_002",
+        source="rss",
+        title="Newer Item",
+        body="Newer item body",
+        published_at=NOW + timedelta(seconds=1),
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def _store_singleton():
+    """Create one InMemoryStore (and its index) for the whole session.
+
+    Tests run on the single session-scoped event loop (see pyproject.toml),
+    so the store's lock is only ever used from one loop.
+    """
+    return InMemoryStore()
+
 
 class TestInMemoryStore:
     """Test cases for the InMemoryStore implementation."""
 
     @pytest_asyncio.fixture
-    async def store(self):
-        """Create a fresh InMemoryStore for each test."""
-        store = InMemoryStore()
-        yield store
-        await store.clear()
+    async def store(self, _store_singleton):
+        """Provide the shared store, emptied before each test."""
+        await _store_singleton.clear()
+        return _store_singleton
 
     @pytest.fixture
     def sample_item(self):
         """Create a sample news item for testing."""
-        return NewsItem(
+        return NewsItem.model_construct(
             id="test_001",
             source="reddit",
             title="Test Security Vulnerability",
             body="This is a test security issue",
-            published_at=datetime.now(timezone.utc),
+            published_at=NOW,
             version=1,
         )
 
-    @pytest.mark.asyncio
     async def test_add_item_success(self, store, sample_item):
         """Test successfully adding a single item."""
         result = await store.add_item(sample_item)
         assert result is True
         assert await store.count() == 1
 
-    @pytest.mark.asyncio
     async def test_add_item_duplicate(self, store, sample_item):
         """Test that duplicate items are rejected."""
         # Add item first time
@@ -50,50 +92,97 @@ class TestInMemoryStore:
         assert result2 is False
         assert await store.count() == 1
 
-    @pytest.mark.asyncio
     async def test_add_items_success(self, store):
         """Test successfully adding multiple items."""
+        # Awaited in sequence: add_items yields between batches, so a
+        # concurrent count() could observe a partial insert
+        added_count = await store.add_items(list(_SAMPLE_ITEMS))
+        assert added_count == 3
+        assert await store.count() == 3
+
+    async def test_add_items_in_batches(self, store, sample_item):
+        """Test that batched writes still add every item and skip duplicates."""
         items = [
-            NewsItem(
-                id=f"test_{i:03d}",
-                source="reddit",
-                title=f"Test Item {i}",
-                body=f"Test body for item {i}",
-                published_at=datetime.now(timezone.utc),
+            NewsItem.model_construct(
+                id=f"batch_{i:03d}",
+                source="rss",
+                title=f"Batch Item {i}",
+                body=f"Batch body for item {i}",
+                published_at=NOW,
             )
-            for i in range(1, 4)
+            for i in range(7)
         ]
+        await store.add_item(sample_item)
 
-        added_count = await store.add_items(items)
-        assert added_count == 3
-        assert await store.count() == 3
+        added_count = await store.add_items(items + [sample_item], batch_size=3)
+        assert added_count == 7
+        assert await store.count() == 8
 
-    @pytest.mark.asyncio
-    async def test_get_all_with_items(self, store):
-        """Test getting all items with consistent ordering."""
-        # Create items with different timestamps
-        now = datetime.now(timezone.utc)
+        with pytest.raises(ValueError):
+            await store.add_items(items, batch_size=0)
+
+    async def test_add_items_concurrent_dedup(self, store):
+        """Test that overlapping concurrent writes store each item once."""
         items = [
-            NewsItem(
-                id="test_001",
-                source="reddit",
-                title="Older Item",
-                body="Older item body",
-                published_at=now,
-            ),
-            NewsItem(
-                id="test_002",
+            NewsItem.model_construct(
+                id=f"concurrent_{i:03d}",
                 source="rss",
-                title="Newer Item",
-                body="Newer item body",
-                published_at=now + timedelta(seconds=1),
-            ),
+                title=f"Concurrent Item {i}",
+                published_at=NOW,
+            )
+            for i in range(6)
         ]
 
-        await store.add_items(items)
+        # add_items yields between batches, so with one item per batch the
+        # writers alternate: 0, 2, 1, 3, (2), 4, (3), 5. The second writer
+        # therefore wins the overlapping items; run back to back it would be
+        # [4, 2] instead.
+        added = await asyncio.gather(
+            store.add_items(items[:4], batch_size=1),
+            store.add_items(items[2:], batch_size=1),
+        )
+
+        assert added == [2, 4]
+        assert await store.count() == 6
+        assert len(await store.get_all()) == 6
+
+    async def test_get_many(self, store, sample_item):
+        """Test bulk lookup keeps input order and returns None for missing IDs."""
+        await store.add_item(sample_item)
+
+        results = await store.get_many(["missing_001", sample_item.id])
+        assert results == [None, sample_item]
+        assert await store.get_many([]) == []
+
+    async def test_get_all_with_items(self, store):
+        """Test getting all items with consistent ordering."""
+        await store.add_items(list(_OLDER_NEWER_ITEMS))
         retrieved_items = await store.get_all()
 
         # Should be sorted by published_at DESC, then by id ASC
         assert len(retrieved_items) == 2
         assert retrieved_items[0].id == "test_002"  # Newer first
         assert retrieved_items[1].id == "test_001"  # Older second
+
+    async def test_get_all_since_and_limit(self, store):
+        """Test that since is exclusive and limit keeps the newest items."""
+        items = [
+            NewsItem.model_construct(
+                id=f"test_{i:03d}",
+                source="rss",
+                title=f"Item {i}",
+                published_at=NOW + timedelta(minutes=i),
+            )
+            for i in range(5)
+        ]
+        await store.add_items(items)
+
+        newer = await store.get_all(since=NOW + timedelta(minutes=2))
+        assert [item.id for item in newer] == ["test_004", "test_003"]
+
+        latest = await store.get_all(limit=2)
+        assert [item.id for item in latest] == ["test_004", "test_003"]
+
+        assert await store.get_all(since=NOW + timedelta(minutes=4)) == []
+        with pytest.raises(ValueError):
+            await store.get_all(limit=-1)